@@ -31,37 +31,57 @@ from . import psd_handler
 @persistent
 def on_load_post(dummy):
     """Handler called after a blend file is loaded"""
+    common.invalidate_enabled_objects()
     try:
         scene = bpy.context.scene
         if not hasattr(scene, 'cam_proj_paint'):
             return
         
-        # Auto-start watchdog if enabled
+        # Auto-start file watching if enabled (polls when watchdog is missing)
         if scene.cam_proj_paint.auto_reload_enabled:
-            if psd_watcher.WATCHDOG_AVAILABLE:
-                if psd_watcher.start_watching_psd_file(scene):
-                    print("Camera Projection Paint: Auto-reload enabled - watching PSD file for changes")
-                else:
-                    print("Camera Projection Paint: Failed to start auto-reload on file load")
+            if psd_watcher.start_watching_psd_file(scene):
+                print("Camera Projection Paint: Auto-reload enabled - watching PSD file for changes")
             else:
-                print("Camera Projection Paint: Watchdog not available - cannot start auto-reload")
+                print("Camera Projection Paint: Failed to start auto-reload on file load")
     except Exception as e:
         print(f"Camera Projection Paint: Error in load_post handler: {e}")
 
+@persistent
+def on_save_pre(dummy):
+    """Handler called before a blend file is saved"""
+    try:
+        # Layers reloaded from the PSD skip repacking; embed their pixels now
+        psd_handler.pack_pending_images()
+    except Exception as e:
+        print(f"Camera Projection Paint: Error in save_pre handler: {e}")
+
+@persistent
+def on_undo_redo_post(scene, *args):
+    """Handler called after undo/redo; cached object references may be freed"""
+    common.invalidate_enabled_objects()
+
 @persistent
 def on_projection_psd_reload(scene, depsgraph):
     """Automatically apply projection image when it's reloaded"""
+    # Objects may have been added, removed or toggled
+    common.invalidate_enabled_objects()
     try:
         projection_psd = scene.cam_proj_paint.projection_psd_file
         if not projection_psd:
             return
         
+        # Most updates (transforms, edits, frame changes) touch no images
+        if not depsgraph.id_type_updated('IMAGE'):
+            return
+        
         # Check if the projection psd was updated
         for update in depsgraph.updates:
             if hasattr(update, 'id') and update.id == projection_psd:
                 print(f"Projection psd '{projection_psd.name}' was reloaded, applying to objects...")
-                # Use a timer to defer the apply operation slightly
-                bpy.app.timers.register(lambda: apply_projection_delayed(), first_interval=0.5)
+                # Use a timer to defer the apply operation slightly; bursts of
+                # updates share the already pending timer
+                if not bpy.app.timers.is_registered(apply_projection_delayed):
+                    bpy.app.timers.register(apply_projection_delayed, first_interval=0.5)
                 break
     except Exception as e:
         # Silently fail to avoid spamming console
@@ -86,15 +106,15 @@ def apply_projection_delayed():
 def parse_ignore_prefixes(scene):
     """Parse the comma-separated ignore prefixes from the scene property.
 
-    Returns a list of lower-cased prefixes with whitespace trimmed. Empty items
-    are removed. If the property is empty, returns an empty list.
+    Returns a tuple of lower-cased prefixes with whitespace trimmed. Empty items
+    are removed. If the property is empty, returns an empty tuple.
     """
     try:
         raw = scene.cam_proj_paint.ignore_material_prefixes
     except Exception:
-        return []
+        return ()
 
-    return common.parse_comma_separated_list(raw, lowercase=True, strip_whitespace=True)
+    return common.get_prefix_tuple(raw)
 
 def get_mat_data_by_id(obj, slot_id):
     if not hasattr(obj, 'cam_proj_paint') or not obj.cam_proj_paint:
@@ -116,24 +136,53 @@ def get_mat_data_by_og_mat_name(obj, mat_name):
         if md.original_material_name == mat_name:
             return md
 
+def get_texture_node_entries(objects):
+    """
+    Flatten objects -> material data -> texture nodes into a single list.
+    
+    Args:
+        objects: Objects with cam_proj_paint data
+    
+    Returns:
+        list: (obj, mat_data, tex_node_data) tuples
+    """
+    entries = []
+    for obj in objects:
+        for mat_data in obj.cam_proj_paint.material_data:
+            for tex_node_data in mat_data.texture_nodes:
+                entries.append((obj, mat_data, tex_node_data))
+    return entries
+
+# Enum items must stay referenced while Blender uses them, so the lists are
+# kept here: a shared "None only" list and the last PSD file's layer items
+_NO_PSD_LAYER_ITEMS = [('NONE', "None", "No PSD layer assigned", 'X', 0)]
+_psd_layer_items_cache = {'key': None, 'items': _NO_PSD_LAYER_ITEMS}
+
 def get_psd_layer_items(self, context):
     """Dynamic enum items for PSD layer selection"""
-    items = [('NONE', "None", "No PSD layer assigned", 'X', 0)]
-    
     scene = context.scene
     if not scene or not hasattr(scene, 'cam_proj_paint'):
-        return items
+        return _NO_PSD_LAYER_ITEMS
     
     settings = scene.cam_proj_paint
-    if not settings.projection_psd_file:
-        return items
+    psd_file_path = settings.projection_psd_file
+    if not psd_file_path:
+        return _NO_PSD_LAYER_ITEMS
     
-    if not os.path.exists(settings.projection_psd_file):
-        return items
+    # Rebuild only when the file path or its modification stamp changes
+    stamp = psd_handler.get_file_stamp(psd_file_path)
+    if stamp is None:
+        return _NO_PSD_LAYER_ITEMS
+    
+    key = (psd_file_path, stamp)
+    if _psd_layer_items_cache['key'] == key:
+        return _psd_layer_items_cache['items']
+    
+    items = list(_NO_PSD_LAYER_ITEMS)
     
     # Get PSD layers
     try:
-        psd_layers = psd_handler.get_psd_layer_list(settings.projection_psd_file)
+        psd_layers = psd_handler.get_psd_layer_list(psd_file_path)
         if psd_layers:
             for idx, (layer_name, is_group) in enumerate(psd_layers):
                 if not is_group:  # Only show non-group layers
@@ -142,7 +191,10 @@ def get_psd_layer_items(self, context):
                     items.append((layer_name, layer_name, f"PSD Layer: {layer_name}", icon, idx + 1))
     except Exception as e:
         print(f"Failed to get PSD layers for enum: {e}")
+        return items
     
+    _psd_layer_items_cache['key'] = key
+    _psd_layer_items_cache['items'] = items
     return items
 
 # =====================================================================
@@ -252,6 +304,8 @@ def on_projection_filter_update(self, context):
 
 def on_enabled_update(self, context):
     """Update callback when object enabled state changes"""
+    common.invalidate_enabled_objects()
+    
     # Find the object that owns this property
     obj = None
     for o in bpy.data.objects:
@@ -523,7 +577,7 @@ def setup_obj_projection_uv_and_visibility(obj, camera, context):
         selection_state = common.store_selection_state(context)
         
         # Deselect all objects
-        bpy.ops.object.select_all(action='DESELECT')
+        common.deselect_all_objects(context)
         
         # Select and make active
         obj.select_set(True)
@@ -543,7 +597,7 @@ def setup_obj_projection_uv_and_visibility(obj, camera, context):
             print(f"  {obj.name}: Ensured '{common.PROJECTION_UV_NAME}' UV map on target")
 
         # Duplicate the object and apply deforming modifiers on the duplicate
-        bpy.ops.object.select_all(action='DESELECT')
+        common.deselect_all_objects(context)
         obj.select_set(True)
         context.view_layer.objects.active = obj
         bpy.ops.object.duplicate()
@@ -586,7 +640,7 @@ def setup_obj_projection_uv_and_visibility(obj, camera, context):
         # Transfer UVs from duplicate (source) to original (target) using topology mapping
         try:
             # Ensure both objects are selected and duplicate is active (source)
-            bpy.ops.object.select_all(action='DESELECT')
+            common.deselect_all_objects(context)
             obj.select_set(True)
             duplicate_obj.select_set(True)
             context.view_layer.objects.active = duplicate_obj
@@ -629,7 +683,7 @@ def setup_obj_projection_uv_and_visibility(obj, camera, context):
                     # Add a new vertex color layer on the original if it doesn't exist
                     if not obj.data.vertex_colors.get(common.PROJECTION_VIS_VCOL_NAME):
                         obj.data.vertex_colors.new(name=common.PROJECTION_VIS_VCOL_NAME)
-                    bpy.ops.object.select_all(action='DESELECT')
+                    common.deselect_all_objects(context)
                     obj.select_set(True)
                     duplicate_obj.select_set(True)
                     context.view_layer.objects.active = duplicate_obj
@@ -944,7 +998,6 @@ def setup_projection_mix(mat, og_img_node, proj_img, context, dest_socket=None,
         
     except Exception as e:
         print(f"Error setting up projection mix: {str(e)}")
-        import traceback
         traceback.print_exc()
         return None, None
 
@@ -994,7 +1047,6 @@ def bake_projection_core_psd(context, enabled_objects, render_backend):
     """
     Bake loop for handling multiple bakes per material.
     """
-    import traceback
 
     # Store original selection and active object
     selection_state = common.store_selection_state(context)
@@ -1146,9 +1198,12 @@ def bake_projection_core_psd(context, enabled_objects, render_backend):
     print(f"Baked {total_texture_nodes_baked} texture node(s) on {baked_count}/{len(enabled_objects)} objects")
     print("="*50 + "\n")
 
+    # Free the pixel copy scratch buffers
+    common.release_pixel_buffers()
+
     # Cleanup temporary collection if empty (UV bake temp)
     temp_collection = bpy.data.collections.get(common.UV_BAKE_TEMP_COLLECTION)
-    if temp_collection and len(temp_collection.objects) == 0:
+    if temp_collection and not temp_collection.objects:
         try:
             common.remove_collection(temp_collection)
         except:
@@ -1264,7 +1319,7 @@ def cycles_backend_psd(sep_obj, context, tex_node_data):
 
         # Select separated object and make active
         try:
-            bpy.ops.object.select_all(action='DESELECT')
+            common.deselect_all_objects(context)
         except:
             pass
         sep_obj.select_set(True)
@@ -1322,8 +1377,10 @@ def has_bake_materials_ready(enabled_objects):
         bool: True if bake materials are found, False otherwise
     """
     return any(
-        any(any(tn.bake_material_name for tn in mat_data.texture_nodes) for mat_data in obj.cam_proj_paint.material_data)
+        tn.bake_material_name
         for obj in enabled_objects
+        for mat_data in obj.cam_proj_paint.material_data
+        for tn in mat_data.texture_nodes
     )
 
 def has_bake_targets_ready(enabled_objects):
@@ -1337,10 +1394,37 @@ def has_bake_targets_ready(enabled_objects):
         bool: True if bake target textures are found, False otherwise
     """
     return any(
-        any(any(tn.bake_target_texture for tn in mat_data.texture_nodes) for mat_data in obj.cam_proj_paint.material_data)
+        tn.bake_target_texture
         for obj in enabled_objects
+        for mat_data in obj.cam_proj_paint.material_data
+        for tn in mat_data.texture_nodes
     )
 
+def get_finalize_state(enabled_objects):
+    """
+    Check PSD mapping, bake material and bake target state in a single pass.
+    
+    Args:
+        enabled_objects: List of enabled objects to check
+        
+    Returns:
+        tuple: (has_mapping, bake_ready, targets_ready) booleans
+    """
+    has_mapping = False
+    bake_ready = False
+    targets_ready = False
+    for obj in enabled_objects:
+        for mat_data in obj.cam_proj_paint.material_data:
+            has_mapping = True
+            for tn in mat_data.texture_nodes:
+                if not bake_ready and tn.bake_material_name:
+                    bake_ready = True
+                if not targets_ready and tn.bake_target_texture:
+                    targets_ready = True
+                if bake_ready and targets_ready:
+                    return True, True, True
+    return has_mapping, bake_ready, targets_ready
+
 def object_has_preview_materials(obj):
     """
     Check if the given object has any preview materials assigned.
@@ -1350,10 +1434,7 @@ def object_has_preview_materials(obj):
     Returns:
         bool: True if any preview materials are assigned, False otherwise
     """
-    return any(
-        bpy.data.materials.get(mat_data.preview_material_name) is not None
-        for mat_data in obj.cam_proj_paint.material_data
-    )
+    return common.object_has_material_suffix(obj, common.PREVIEW_MAT_SUFFIX)
 
 def is_image_a_psd_layer(image, psd_file_path):
     """
@@ -1503,7 +1584,6 @@ def reload_texture_node(tex_node_data, context):
             
     except Exception as e:
         print(f"Error reloading texture node '{tex_node_data.node_name}': {str(e)}")
-        import traceback
         traceback.print_exc()
 
 # =====================================================================
@@ -1794,10 +1874,6 @@ class CAMPROJPAINT_OT_toggle_auto_reload(Operator):
     def execute(self, context):
         scene = context.scene
         
-        if not psd_watcher.WATCHDOG_AVAILABLE:
-            self.report({'ERROR'}, "Watchdog library not installed. Install with pip.")
-            return {'CANCELLED'}
-        
         if not psd_watcher.is_watching():
             # Start watching
             if psd_watcher.start_watching_psd_file(scene):
@@ -1892,7 +1968,7 @@ class CAMPROJPAINT_OT_select_enabled_objects(Operator):
             return {'CANCELLED'}
         
         try:
-            bpy.ops.object.select_all(action='DESELECT')
+            common.deselect_all_objects(context)
         except:
             pass
         
@@ -1972,7 +2048,6 @@ class CAMPROJPAINT_OT_auto_map_psd_layers(Operator):
             self.report({'ERROR'}, "No PSD file selected")
             return {'CANCELLED'}
         
-        import os
         if not os.path.exists(settings.projection_psd_file):
             self.report({'ERROR'}, "PSD file not found")
             return {'CANCELLED'}
@@ -2017,7 +2092,8 @@ class CAMPROJPAINT_OT_set_project_visible(Operator):
         
         # Get enabled objects
         enabled_objects = common.get_enabled_objects(context)
-        selected_enabled = [obj for obj in context.selected_objects if obj in enabled_objects]
+        enabled_set = set(enabled_objects)
+        selected_enabled = [obj for obj in context.selected_objects if obj in enabled_set]
         
         # If nothing selected, use all enabled objects
         if not selected_enabled:
@@ -2084,7 +2160,8 @@ class CAMPROJPAINT_OT_set_project_all(Operator):
         
         # Get enabled objects
         enabled_objects = common.get_enabled_objects(context)
-        selected_enabled = [obj for obj in context.selected_objects if obj in enabled_objects]
+        enabled_set = set(enabled_objects)
+        selected_enabled = [obj for obj in context.selected_objects if obj in enabled_set]
         
         # If nothing selected, use all enabled objects
         if not selected_enabled:
@@ -2144,7 +2221,8 @@ class CAMPROJPAINT_OT_set_project_preserve(Operator):
     def execute(self, context):
         # Get enabled objects
         enabled_objects = common.get_enabled_objects(context)
-        selected_enabled = [obj for obj in context.selected_objects if obj in enabled_objects]
+        enabled_set = set(enabled_objects)
+        selected_enabled = [obj for obj in context.selected_objects if obj in enabled_set]
         
         # If nothing selected, use all enabled objects
         if not selected_enabled:
@@ -2187,7 +2265,8 @@ class CAMPROJPAINT_OT_enable_preserve_uv(Operator):
     def execute(self, context):
         # Get enabled objects
         enabled_objects = common.get_enabled_objects(context)
-        selected_enabled = [obj for obj in context.selected_objects if obj in enabled_objects]
+        enabled_set = set(enabled_objects)
+        selected_enabled = [obj for obj in context.selected_objects if obj in enabled_set]
         
         # If nothing selected, use all enabled objects
         if not selected_enabled:
@@ -2233,7 +2312,8 @@ class CAMPROJPAINT_OT_disable_preserve_uv(Operator):
     def execute(self, context):
         # Get enabled objects
         enabled_objects = common.get_enabled_objects(context)
-        selected_enabled = [obj for obj in context.selected_objects if obj in enabled_objects]
+        enabled_set = set(enabled_objects)
+        selected_enabled = [obj for obj in context.selected_objects if obj in enabled_set]
         
         # If nothing selected, use all enabled objects
         if not selected_enabled:
@@ -2285,13 +2365,14 @@ class CAMPROJPAINT_OT_sync_projection_frame(Operator):
         
         # Get enabled objects
         enabled_objects = common.get_enabled_objects(context)
-        selected_enabled = [obj for obj in context.selected_objects if obj in enabled_objects]
+        enabled_set = set(enabled_objects)
+        selected_enabled = [obj for obj in context.selected_objects if obj in enabled_set]
         
         if not selected_enabled:
             self.report({'WARNING'}, "No selected enabled objects")
             return {'CANCELLED'}
         
-        if active_obj not in enabled_objects:
+        if active_obj not in enabled_set:
             self.report({'WARNING'}, "Active object is not enabled")
             return {'CANCELLED'}
         
@@ -2342,6 +2423,7 @@ class CAMPROJPAINT_OT_setup_preview_materials(Operator):
         
         scene = context.scene
         settings = scene.cam_proj_paint
+        materials = bpy.data.materials
         
         processed_count = 0
         total_materials = 0
@@ -2429,10 +2511,9 @@ class CAMPROJPAINT_OT_setup_preview_materials(Operator):
                     texture_nodes_to_process = [(tn, tn.node_name) for tn in mat_data.texture_nodes]
                     
                     # Find or create preview material
-                    preview_mat = None
                     preview_mat_name = f"{original_mat.name}{common.PREVIEW_MAT_SUFFIX}"
-                    if preview_mat_name in bpy.data.materials:
-                        preview_mat = bpy.data.materials[preview_mat_name]
+                    preview_mat = materials.get(preview_mat_name)
+                    if preview_mat:
                         # Replace the material slot with the preview material and continue
                         obj.data.materials[mat_index] = preview_mat
                         mat_data.preview_material_name = preview_mat.name
@@ -2468,7 +2549,6 @@ class CAMPROJPAINT_OT_setup_preview_materials(Operator):
                             print(f"      Node '{node_name}': Extracting PSD layer '{tex_node_data.psd_layer_name}'")
                             # Extract PSD layer
                             if settings.projection_psd_file:
-                                import os
                                 if os.path.exists(settings.projection_psd_file):
                                     layer_img_name = f"PSD_{tex_node_data.psd_layer_name}"
                                     projection_image = psd_handler.extract_single_layer(
@@ -2563,6 +2643,8 @@ class CAMPROJPAINT_OT_setup_bake_materials(Operator):
         scene = context.scene
         settings = scene.cam_proj_paint
         bake_method = settings.bake_method
+        materials = bpy.data.materials
+        images = bpy.data.images
         
         processed_obj_count = 0
         total_materials = 0
@@ -2609,11 +2691,17 @@ class CAMPROJPAINT_OT_setup_bake_materials(Operator):
                 # Ensure material data entry exists
                 ensure_obj_material_data(obj, ignore_prefixes)
                 
+                # Snapshot material/image names once per object instead of an ID
+                # lookup per texture node (taken after restore_original_materials,
+                # which may have removed some of them)
+                existing_materials = {m.name: m for m in materials}
+                existing_images = {img.name: img for img in images}
+                
                 print(f"\n  {obj.name}:")
                 
                 # Create one bake material per texture node
                 for mat_data in obj.cam_proj_paint.material_data:
-                    original_mat = bpy.data.materials.get(mat_data.original_material_name)
+                    original_mat = existing_materials.get(mat_data.original_material_name)
                     if not original_mat:
                         continue
                     
@@ -2626,7 +2714,7 @@ class CAMPROJPAINT_OT_setup_bake_materials(Operator):
                         total_tex_nodes += 1
                         # Check if this texture node already has a bake material
                         if tex_node_data.bake_material_name:
-                            existing_bake_mat = bpy.data.materials.get(tex_node_data.bake_material_name)
+                            existing_bake_mat = existing_materials.get(tex_node_data.bake_material_name)
                             if existing_bake_mat:
                                 print(f"      Node '{tex_node_data.node_name}': Skipped (bake material already exists)")
                                 continue
@@ -2644,10 +2732,11 @@ class CAMPROJPAINT_OT_setup_bake_materials(Operator):
                         
                         # Create unique bake material for this specific texture node
                         bake_mat_name = f"{obj.name}__{original_mat.name}__{tex_node_data.node_name}{common.BAKE_MAT_SUFFIX}"
-                        bake_mat = bpy.data.materials.new(name=bake_mat_name)
+                        bake_mat = materials.new(name=bake_mat_name)
                         bake_mat.use_nodes = True
                         bake_mat.use_fake_user = True  # Prevent deletion since not assigned to any slot
                         tex_node_data.bake_material_name = bake_mat.name
+                        existing_materials[bake_mat.name] = bake_mat
                         
                         # Clear default nodes
                         bake_nodes = bake_mat.node_tree.nodes
@@ -2734,7 +2823,7 @@ class CAMPROJPAINT_OT_setup_bake_materials(Operator):
                             height = 2048
                         
                         bake_target_name = f"{obj.name}__{original_mat.name}__{tex_node_data.node_name}{common.BAKE_TARGET_IMG_SUFFIX}"
-                        bake_target_tex = bpy.data.images.get(bake_target_name)
+                        bake_target_tex = existing_images.get(bake_target_name)
                         
                         if bake_target_tex:
                             # Reuse existing image, but ensure it has the correct size
@@ -2747,6 +2836,8 @@ class CAMPROJPAINT_OT_setup_bake_materials(Operator):
                                 width=width,
                                 height=height
                             )
+                            if bake_target_tex:
+                                existing_images[bake_target_tex.name] = bake_target_tex
                         
                         tex_node_data.bake_target_texture = bake_target_tex
                         
@@ -2785,7 +2876,6 @@ class CAMPROJPAINT_OT_setup_bake_materials(Operator):
                 
             except Exception as e:
                 print(f"  {obj.name}: ✗ Error - {str(e)}")
-                import traceback
                 traceback.print_exc()
                 self.report({'WARNING'}, f"Failed to setup bake materials for {obj.name}: {str(e)}")
         
@@ -2812,6 +2902,7 @@ class CAMPROJPAINT_OT_reload_projection_image(Operator):
     def execute(self, context):
         settings = context.scene.cam_proj_paint
         psd_file_path = settings.projection_psd_file
+        materials = bpy.data.materials
         
         if not psd_file_path:
             self.report({'ERROR'}, "No PSD file selected")
@@ -2871,7 +2962,8 @@ class CAMPROJPAINT_OT_reload_projection_image(Operator):
                                 psd_file_path,
                                 tex_node_data.psd_layer_name,
                                 as_blender_image=True,
-                                image_name=f"PSD_{tex_node_data.psd_layer_name}"
+                                image_name=f"PSD_{tex_node_data.psd_layer_name}",
+                                pack=False
                             )
                             
                             if not layer_image:
@@ -2883,7 +2975,7 @@ class CAMPROJPAINT_OT_reload_projection_image(Operator):
                             continue
                         
                         # Update bake material if it exists
-                        bake_mat = bpy.data.materials.get(tex_node_data.bake_material_name)
+                        bake_mat = materials.get(tex_node_data.bake_material_name)
                         if bake_mat and bake_mat.use_nodes:
                             nodes = bake_mat.node_tree.nodes
                             projection_tex_node = nodes.get(tex_node_data.projection_texture_node_name)
@@ -2900,7 +2992,7 @@ class CAMPROJPAINT_OT_reload_projection_image(Operator):
                                 print(f"    Node '{tex_node_data.node_name}': ✗ Projection texture node '{tex_node_data.projection_texture_node_name}' not found in bake material")
                         
                         # Update preview material if it exists
-                        preview_mat = bpy.data.materials.get(mat_data.preview_material_name)
+                        preview_mat = materials.get(mat_data.preview_material_name)
                         if preview_mat and preview_mat.use_nodes:
                             nodes = preview_mat.node_tree.nodes
                             projection_tex_node = nodes.get(tex_node_data.projection_texture_node_name)
@@ -2930,6 +3022,10 @@ class CAMPROJPAINT_OT_reload_projection_image(Operator):
                 print(f"  {obj.name}: ✗ Error - {str(e)}")
                 traceback.print_exc()
         
+        # Free the parsed PSD file and the layer pixel scratch buffer
+        psd_handler.release_open_psd_files()
+        psd_handler.release_pixel_buffer()
+        
         print("="*50)
         print(f"Reloaded {total_texture_nodes} texture node(s) on {updated_count}/{len(enabled_objects)} objects")
         print("="*50 + "\n")
@@ -2957,14 +3053,7 @@ class CAMPROJPAINT_OT_bake_projection(Operator):
             return {'CANCELLED'}
 
         # Check if any enabled objects have bake materials set up
-        has_bake_materials = False
-        for obj in enabled_objects:
-            for mat_data in obj.cam_proj_paint.material_data:
-                if any(tn.bake_material_name for tn in mat_data.texture_nodes):
-                    has_bake_materials = True
-                    break
-        
-        if not has_bake_materials:
+        if not has_bake_materials_ready(enabled_objects):
             self.report({'ERROR'}, "No bake materials found. Run 'Setup Bake Materials' first")
             return {'CANCELLED'}
 
@@ -3011,14 +3100,7 @@ class CAMPROJPAINT_OT_bake_projection_eevee(Operator):
             return {'CANCELLED'}
 
         # Check if any enabled objects have bake materials set up
-        has_bake_materials = False
-        for obj in enabled_objects:
-            for mat_data in obj.cam_proj_paint.material_data:
-                if any(tn.bake_material_name for tn in mat_data.texture_nodes):
-                    has_bake_materials = True
-                    break
-        
-        if not has_bake_materials:
+        if not has_bake_materials_ready(enabled_objects):
             self.report({'ERROR'}, "No bake materials found. Run 'Setup Bake Materials' first")
             return {'CANCELLED'}
 
@@ -3041,80 +3123,99 @@ class CAMPROJPAINT_OT_apply_baked_result(Operator):
     bl_options = {'REGISTER', 'UNDO'}
     
     def execute(self, context):
-        # Get enabled objects for baking
-        enabled_objects = common.get_enabled_objects(context)
-        
-        if not enabled_objects:
-            self.report({'WARNING'}, "No baked images found. Run 'Bake Projection' first")
-            return {'CANCELLED'}
-        
-        applied_count = 0
-        total_tex_nodes_applied = 0  # Materials in single-texture mode, texture nodes in PSD mode
-        
-        print("\n" + "="*50)
-        print("Applying baked results to original textures (PSD Multi-Texture Mode)")
-        print("="*50)
+        log = common.ConsoleLog()
         
-        for obj in enabled_objects:
-            try:
-                obj_items_applied = 0
+        try:
+            # Get enabled objects for baking
+            enabled_objects = common.get_enabled_objects(context)
+            
+            if not enabled_objects:
+                self.report({'WARNING'}, "No baked images found. Run 'Bake Projection' first")
+                return {'CANCELLED'}
+            
+            applied_count = 0
+            total_tex_nodes_applied = 0  # Materials in single-texture mode, texture nodes in PSD mode
+            
+            # Images composited onto, refreshed once after all nodes are applied
+            updated_images = set()
+            
+            log("\n" + "="*50)
+            log("Applying baked results to original textures (PSD Multi-Texture Mode)")
+            log("="*50)
+            
+            # Texture nodes applied per object (keeps objects with nothing to apply)
+            applied_per_object = dict.fromkeys(enabled_objects, 0)
+            
+            # Group bake targets by the original image they are applied to, so a
+            # texture shared by several nodes is read and written only once
+            bake_targets_by_image = {}
+            
+            for obj, mat_data, tex_node_data in get_texture_node_entries(enabled_objects):
+                bake_target_tex = tex_node_data.bake_target_texture
+                original_img = tex_node_data.original_texture
                 
-                # Iterate through each material data
-                for mat_data in obj.cam_proj_paint.material_data:
-                    
-                    if not mat_data.texture_nodes:
-                        continue
+                if not bake_target_tex or not original_img:
+                    if log.enabled:
+                        log(f"    Node '{tex_node_data.node_name}': ✗ Missing images")
+                    continue
+                
+                # Per-node messages are only formatted when they will be printed
+                if log.enabled:
+                    width = bake_target_tex.size[0]
+                    height = bake_target_tex.size[1]
+                    layer_info = f" (PSD: {tex_node_data.psd_layer_name})" if tex_node_data.psd_layer_name else ""
+                    log(f"    Node '{tex_node_data.node_name}'{layer_info}: Applying '{bake_target_tex.name}' → '{original_img.name}' ({width}x{height})")
+                
+                bake_targets_by_image.setdefault(original_img, []).append((obj, tex_node_data, bake_target_tex))
+            
+            for original_img, entries in bake_targets_by_image.items():
+                try:
+                    # Alpha compositing from bake targets to original texture
+                    common.alpha_composite_image_stack([bake_target_tex for _, _, bake_target_tex in entries], original_img)
+                    updated_images.add(original_img)
                     
-                    for tex_node_data in mat_data.texture_nodes:
-                        bake_target_tex = tex_node_data.bake_target_texture
-                        original_img = tex_node_data.original_texture
-                        
-                        if not bake_target_tex or not original_img:
-                            print(f"    Node '{tex_node_data.node_name}': ✗ Missing images")
-                            continue
-                        
-                        # Alpha compositing from bake target to original texture
-                        width = bake_target_tex.size[0]
-                        height = bake_target_tex.size[1]
-                        layer_info = f" (PSD: {tex_node_data.psd_layer_name})" if tex_node_data.psd_layer_name else ""
-                        print(f"    Node '{tex_node_data.node_name}'{layer_info}: Applying '{bake_target_tex.name}' → '{original_img.name}' ({width}x{height})")
-                        
-                        common.alpha_composite_images(bake_target_tex, original_img)
-                        
-                        # Update the image
-                        original_img.update()
-                        original_img.update_tag()
-                        
-                        print(f"    Node '{tex_node_data.node_name}': ✓ Applied to '{original_img.name}'")
-                        obj_items_applied += 1
+                    for obj, tex_node_data, _ in entries:
+                        if log.enabled:
+                            log(f"    Node '{tex_node_data.node_name}': ✓ Applied to '{original_img.name}'")
+                        applied_per_object[obj] += 1
                         total_tex_nodes_applied += 1
-                
+                    
+                except Exception as e:
+                    log(f"  '{original_img.name}': ✗ Error - {str(e)}")
+                    log.print_exc()
+                    for obj in {obj for obj, _, _ in entries}:
+                        self.report({'WARNING'}, f"Failed to apply result for {obj.name}: {str(e)}")
+            
+            for obj, obj_items_applied in applied_per_object.items():
                 if obj_items_applied > 0:
-                    print(f"  {obj.name}: ✓ Applied {obj_items_applied} texture node(s)")
+                    log(f"  {obj.name}: ✓ Applied {obj_items_applied} texture node(s)")
                     applied_count += 1
                 else:
-                    print(f"  {obj.name}: ✗ No items applied")
-                
-            except Exception as e:
-                print(f"  {obj.name}: ✗ Error - {str(e)}")
-                import traceback
-                traceback.print_exc()
-                self.report({'WARNING'}, f"Failed to apply result for {obj.name}: {str(e)}")
-        
-        print("="*50)
-        print(f"Applied {total_tex_nodes_applied} texture nodes on {applied_count}/{len(enabled_objects)} objects")
-        print("="*50 + "\n")
-        
-        # Force viewport refresh to update texture display in all shading modes
-        common.refresh_viewport(context)
-        
-        if applied_count > 0:
-            self.report({'INFO'}, f"Applied {total_tex_nodes_applied} texture nodes on {applied_count} objects. Run 'Cleanup' to finish")
-        else:
-            self.report({'ERROR'}, "Failed to apply any baked results")
-            return {'CANCELLED'}
-        
-        return {'FINISHED'}
+                    log(f"  {obj.name}: ✗ No items applied")
+            
+            # Free the composite scratch buffers
+            common.release_pixel_buffers()
+            
+            # Update each modified image once, even if several nodes share it
+            for img in updated_images:
+                img.update()
+                img.update_tag()
+            
+            log("="*50)
+            log(f"Applied {total_tex_nodes_applied} texture nodes on {applied_count}/{len(enabled_objects)} objects")
+            log("="*50 + "\n")
+            
+            if applied_count > 0:
+                # Force viewport refresh to update texture display in all shading modes
+                common.refresh_viewport(context)
+                self.report({'INFO'}, f"Applied {total_tex_nodes_applied} texture nodes on {applied_count} objects. Run 'Cleanup' to finish")
+            else:
+                self.report({'ERROR'}, "Failed to apply any baked results")
+                return {'CANCELLED'}
+            
+            return {'FINISHED'}
+        finally:
+            log.flush()
 
 class CAMPROJPAINT_OT_remove_temp_materials(Operator):
     """Remove temporary materials and textures, restore original materials"""
@@ -3124,109 +3225,128 @@ class CAMPROJPAINT_OT_remove_temp_materials(Operator):
     bl_options = {'REGISTER', 'UNDO'}
     
     def execute(self, context):
-        # Get enabled objects for cleanup
-        enabled_objects = common.get_enabled_objects(context)
+        log = common.ConsoleLog()
         
-        if not enabled_objects:
-            self.report({'WARNING'}, "No enabled objects to clean up")
-            return {'CANCELLED'}
+        try:
+            # Get enabled objects for cleanup
+            enabled_objects = common.get_enabled_objects(context)
+            
+            if not enabled_objects:
+                self.report({'WARNING'}, "No enabled objects to clean up")
+                return {'CANCELLED'}
 
-        cleaned_count = 0
-        total_materials_cleaned = 0
-        total_items_cleaned = 0 
-        
-        print("\n" + "="*50)
-        print("Removing temporary materials and textures (preserving PSD layer mapping)")
-        print("="*50)
-        
-        for obj in enabled_objects:
-            try:
-                obj_materials_cleaned = 0
-                obj_items_cleaned = 0
-                
-                # Iterate through material data (no need to reverse since we're not removing items)
-                for mat_data in obj.cam_proj_paint.material_data:
-                    mat_index = mat_data.material_index
-                    
-                    # Restore original material to the slot
-                    original_mat_name = mat_data.original_material_name
-                    if original_mat_name:
-                        original_mat = bpy.data.materials.get(original_mat_name)
-                        if original_mat:
-                            # Find the material slot and restore
-                            if mat_index < len(obj.material_slots):
-                                obj.material_slots[mat_index].material = original_mat
-                                print(f"    Slot {mat_index}: Restored '{original_mat_name}'")
-                    
-                    # Remove preview material (same for both modes)
-                    preview_mat_name = mat_data.preview_material_name
-                    if preview_mat_name:
-                        preview_mat = bpy.data.materials.get(preview_mat_name)
-                        if preview_mat and common.remove_material(preview_mat):
-                            print(f"    Slot {mat_index}: Removed preview material '{preview_mat_name}'")
-                            # Clear the name reference
-                            mat_data.preview_material_name = ""
+            cleaned_count = 0
+            total_materials_cleaned = 0
+            total_items_cleaned = 0 
+            
+            # Snapshot materials once; entries are dropped as they get removed
+            materials_by_name = {m.name: m for m in bpy.data.materials}
+            
+            log("\n" + "="*50)
+            log("Removing temporary materials and textures (preserving PSD layer mapping)")
+            log("="*50)
+            
+            for obj in enabled_objects:
+                try:
+                    obj_materials_cleaned = 0
+                    obj_items_cleaned = 0
+                    slots = obj.material_slots
+                    n_slots = len(slots)
                     
-                    for tex_node_data in mat_data.texture_nodes:
-                        # Remove bake material for this texture node
-                        if tex_node_data.bake_material_name:
-                            bake_mat = bpy.data.materials.get(tex_node_data.bake_material_name)
-                            if bake_mat and common.remove_material(bake_mat):
-                                print(f"      Node '{tex_node_data.node_name}': Removed bake material '{tex_node_data.bake_material_name}'")
+                    # Iterate through material data (no need to reverse since we're not removing items)
+                    for mat_data in obj.cam_proj_paint.material_data:
+                        mat_index = mat_data.material_index
+                        
+                        # Restore original material to the slot
+                        original_mat_name = mat_data.original_material_name
+                        if original_mat_name:
+                            original_mat = materials_by_name.get(original_mat_name)
+                            if original_mat:
+                                # Find the material slot and restore
+                                if mat_index < n_slots:
+                                    slots[mat_index].material = original_mat
+                                    log(f"    Slot {mat_index}: Restored '{original_mat_name}'")
+                        
+                        # Remove preview material (same for both modes)
+                        preview_mat_name = mat_data.preview_material_name
+                        if preview_mat_name:
+                            preview_mat = materials_by_name.get(preview_mat_name)
+                            if preview_mat and common.remove_material(preview_mat):
+                                del materials_by_name[preview_mat_name]
+                                log(f"    Slot {mat_index}: Removed preview material '{preview_mat_name}'")
                                 # Clear the name reference
-                                tex_node_data.bake_material_name = ""
+                                mat_data.preview_material_name = ""
                         
-                        # Remove bake target image for this texture node
-                        if tex_node_data.bake_target_texture:
-                            img_name = tex_node_data.bake_target_texture.name
-                            common.remove_image(tex_node_data.bake_target_texture)
-                            print(f"      Node '{tex_node_data.node_name}': Removed bake target '{img_name}'")
-                            # Clear the image reference
-                            tex_node_data.bake_target_texture = None
+                        texture_nodes = mat_data.texture_nodes
+                        for tex_node_data in texture_nodes:
+                            # Read each RNA property once per node
+                            node_name = tex_node_data.node_name
+                            bake_mat_name = tex_node_data.bake_material_name
+                            bake_target = tex_node_data.bake_target_texture
+                            
+                            # Remove bake material for this texture node
+                            if bake_mat_name:
+                                bake_mat = materials_by_name.get(bake_mat_name)
+                                if bake_mat and common.remove_material(bake_mat):
+                                    del materials_by_name[bake_mat_name]
+                                    if log.enabled:
+                                        log(f"      Node '{node_name}': Removed bake material '{bake_mat_name}'")
+                                    # Clear the name reference
+                                    tex_node_data.bake_material_name = ""
+                            
+                            # Remove bake target image for this texture node
+                            if bake_target:
+                                img_name = bake_target.name
+                                common.remove_image(bake_target)
+                                if log.enabled:
+                                    log(f"      Node '{node_name}': Removed bake target '{img_name}'")
+                                # Clear the image reference
+                                tex_node_data.bake_target_texture = None
+                            
+                            obj_items_cleaned += 1
+                            total_items_cleaned += 1
                         
-                        obj_items_cleaned += 1
-                        total_items_cleaned += 1
+                        obj_materials_cleaned += 1
+                        total_materials_cleaned += 1
                     
-                    obj_materials_cleaned += 1
-                    total_materials_cleaned += 1
-                
-                # DO NOT clear the material data collection - preserve PSD layer mapping
-                # obj.cam_proj_paint.material_data.clear()
-                
-                # Clear object-level references
-                obj.cam_proj_paint.projection_texture = None
-                
-                if obj_materials_cleaned > 0:
-                    print(f"  {obj.name}: ✓ Cleaned up {obj_materials_cleaned} material(s), {obj_items_cleaned} texture node(s)")
-                    cleaned_count += 1
-                else:
-                    print(f"  {obj.name}: ✗ No materials to clean up")
-                
+                    # DO NOT clear the material data collection - preserve PSD layer mapping
+                    # obj.cam_proj_paint.material_data.clear()
+                    
+                    # Clear object-level references
+                    obj.cam_proj_paint.projection_texture = None
+                    
+                    if obj_materials_cleaned > 0:
+                        log(f"  {obj.name}: ✓ Cleaned up {obj_materials_cleaned} material(s), {obj_items_cleaned} texture node(s)")
+                        cleaned_count += 1
+                    else:
+                        log(f"  {obj.name}: ✗ No materials to clean up")
+                    
+                except Exception as e:
+                    log(f"  {obj.name}: ✗ Error - {str(e)}")
+                    log.print_exc()
+                    self.report({'WARNING'}, f"Failed to cleanup {obj.name}: {str(e)}")
+            
+            log("="*50)
+            log(f"Cleaned up {total_materials_cleaned} materials, {total_items_cleaned} texture nodes on {cleaned_count}/{len(enabled_objects)} objects")
+            log("="*50 + "\n")
+            
+            # Also cleanup UV bake temporary objects and collections
+            log("Cleaning up UV bake temporary data...")
+            try:
+                bpy.ops.uvbake.cleanup_temp()
+                log("✓ UV bake cleanup complete")
             except Exception as e:
-                print(f"  {obj.name}: ✗ Error - {str(e)}")
-                import traceback
-                traceback.print_exc()
-                self.report({'WARNING'}, f"Failed to cleanup {obj.name}: {str(e)}")
-        
-        print("="*50)
-        print(f"Cleaned up {total_materials_cleaned} materials, {total_items_cleaned} texture nodes on {cleaned_count}/{len(enabled_objects)} objects")
-        print("="*50 + "\n")
-        
-        # Also cleanup UV bake temporary objects and collections
-        print("Cleaning up UV bake temporary data...")
-        try:
-            bpy.ops.uvbake.cleanup_temp()
-            print("✓ UV bake cleanup complete")
-        except Exception as e:
-            print(f"Note: UV bake cleanup not available or failed: {str(e)}")
-        
-        if cleaned_count > 0:
-            self.report({'INFO'}, f"Cleanup complete: {total_materials_cleaned} materials, {total_items_cleaned} texture nodes (PSD mapping preserved)")
-        else:
-            self.report({'ERROR'}, "Failed to cleanup any objects")
-            return {'CANCELLED'}
-        
-        return {'FINISHED'}
+                log(f"Note: UV bake cleanup not available or failed: {str(e)}")
+            
+            if cleaned_count > 0:
+                self.report({'INFO'}, f"Cleanup complete: {total_materials_cleaned} materials, {total_items_cleaned} texture nodes (PSD mapping preserved)")
+            else:
+                self.report({'ERROR'}, "Failed to cleanup any objects")
+                return {'CANCELLED'}
+            
+            return {'FINISHED'}
+        finally:
+            log.flush()
 
 class CAMPROJPAINT_OT_clear_psd_mapping(Operator):
     """Clear PSD layer mapping data from all enabled objects"""
@@ -3236,54 +3356,62 @@ class CAMPROJPAINT_OT_clear_psd_mapping(Operator):
     bl_options = {'REGISTER', 'UNDO'}
     
     def execute(self, context):
-        # Get enabled objects
-        enabled_objects = common.get_enabled_objects(context)
-        
-        if not enabled_objects:
-            self.report({'WARNING'}, "No enabled objects")
-            return {'CANCELLED'}
-        
-        cleared_count = 0
-        total_materials = 0
-        total_texture_nodes = 0
-        
-        print("\n" + "="*50)
-        print("Clearing PSD layer mapping data")
-        print("="*50)
+        log = common.ConsoleLog()
         
-        for obj in enabled_objects:
-            try:
-                # Count materials and texture nodes before clearing
-                obj_materials = len(obj.cam_proj_paint.material_data)
-                obj_texture_nodes = sum(len(mat_data.texture_nodes) for mat_data in obj.cam_proj_paint.material_data)
-                
-                if obj_materials > 0:
-                    # Clear the material data collection
-                    obj.cam_proj_paint.material_data.clear()
-                    
-                    total_materials += obj_materials
-                    total_texture_nodes += obj_texture_nodes
-                    cleared_count += 1
-                    
-                    print(f"  {obj.name}: ✓ Cleared {obj_materials} material(s), {obj_texture_nodes} texture node(s)")
-                else:
-                    print(f"  {obj.name}: No mapping data to clear")
+        try:
+            # Get enabled objects
+            enabled_objects = common.get_enabled_objects(context)
+            
+            if not enabled_objects:
+                self.report({'WARNING'}, "No enabled objects")
+                return {'CANCELLED'}
+            
+            cleared_count = 0
+            total_materials = 0
+            total_texture_nodes = 0
+            
+            log("\n" + "="*50)
+            log("Clearing PSD layer mapping data")
+            log("="*50)
+            
+            for obj in enabled_objects:
+                try:
+                    # Count materials and texture nodes before clearing (single pass)
+                    material_data = obj.cam_proj_paint.material_data
+                    obj_materials = 0
+                    obj_texture_nodes = 0
+                    for mat_data in material_data:
+                        obj_materials += 1
+                        obj_texture_nodes += len(mat_data.texture_nodes)
                     
-            except Exception as e:
-                print(f"  {obj.name}: ✗ Error - {str(e)}")
-                import traceback
-                traceback.print_exc()
-        
-        print("="*50)
-        print(f"Cleared {total_materials} materials, {total_texture_nodes} texture nodes from {cleared_count}/{len(enabled_objects)} objects")
-        print("="*50 + "\n")
-        
-        if cleared_count > 0:
-            self.report({'INFO'}, f"Cleared PSD mapping: {total_materials} materials, {total_texture_nodes} texture nodes")
-        else:
-            self.report({'WARNING'}, "No PSD mapping data found to clear")
-        
-        return {'FINISHED'}
+                    if obj_materials > 0:
+                        # Clear the material data collection
+                        material_data.clear()
+                        
+                        total_materials += obj_materials
+                        total_texture_nodes += obj_texture_nodes
+                        cleared_count += 1
+                        
+                        log(f"  {obj.name}: ✓ Cleared {obj_materials} material(s), {obj_texture_nodes} texture node(s)")
+                    else:
+                        log(f"  {obj.name}: No mapping data to clear")
+                        
+                except Exception as e:
+                    log(f"  {obj.name}: ✗ Error - {str(e)}")
+                    log.print_exc()
+            
+            log("="*50)
+            log(f"Cleared {total_materials} materials, {total_texture_nodes} texture nodes from {cleared_count}/{len(enabled_objects)} objects")
+            log("="*50 + "\n")
+            
+            if cleared_count > 0:
+                self.report({'INFO'}, f"Cleared PSD mapping: {total_materials} materials, {total_texture_nodes} texture nodes")
+            else:
+                self.report({'WARNING'}, "No PSD mapping data found to clear")
+            
+            return {'FINISHED'}
+        finally:
+            log.flush()
 
 class CAMPROJPAINT_OT_remove_temp_uvs_vcols(Operator):
     """Remove temporary UV maps and vertex color layers"""
@@ -3293,54 +3421,60 @@ class CAMPROJPAINT_OT_remove_temp_uvs_vcols(Operator):
     bl_options = {'REGISTER', 'UNDO'}
     
     def execute(self, context):
-        # Get enabled objects
-        enabled_objects = common.get_enabled_objects(context)
-        
-        if not enabled_objects:
-            self.report({'WARNING'}, "No enabled objects")
-            return {'CANCELLED'}
-        
-        removed_count = 0
-        
-        print("\n" + "="*50)
-        print("Removing temporary UV maps and vertex color layers")
-        print("="*50)
-        
-        for obj in enabled_objects:
-            try:
-                removed_uv_or_vcol = False
-                
-                # Remove projection UV map
-                if common.remove_uv_layer(obj, common.PROJECTION_UV_NAME):
-                    removed_uv_or_vcol = True
-                    print(f"  {obj.name}: Removed UV map '{common.PROJECTION_UV_NAME}'")
-                        
-                # Remove vertex color layer
-                if common.remove_vertex_color_layer(obj, common.PROJECTION_VIS_VCOL_NAME):
-                    removed_uv_or_vcol = True
-                    print(f"  {obj.name}: Removed vertex color '{common.PROJECTION_VIS_VCOL_NAME}'")
-                
-                if removed_uv_or_vcol:
-                    removed_count += 1
-                    print(f"  {obj.name}: ✓ Removed temporary data")
-                else:
-                    print(f"  {obj.name}: No temporary data to remove")
-                
-            except Exception as e:
-                print(f"  {obj.name}: ✗ Error - {str(e)}")
-                import traceback
-                traceback.print_exc()
-        
-        print("="*50)
-        print(f"Removed temporary data from {removed_count}/{len(enabled_objects)} objects")
-        print("="*50 + "\n")
-        
-        if removed_count > 0:
-            self.report({'INFO'}, f"Removed temporary UVs/VCols from {removed_count} objects")
-        else:
-            self.report({'WARNING'}, "No temporary data found to remove")
+        log = common.ConsoleLog()
         
-        return {'FINISHED'}
+        try:
+            # Get enabled objects
+            enabled_objects = common.get_enabled_objects(context)
+            
+            if not enabled_objects:
+                self.report({'WARNING'}, "No enabled objects")
+                return {'CANCELLED'}
+            
+            removed_count = 0
+            uv_name = common.PROJECTION_UV_NAME
+            vcol_name = common.PROJECTION_VIS_VCOL_NAME
+            
+            log("\n" + "="*50)
+            log("Removing temporary UV maps and vertex color layers")
+            log("="*50)
+            
+            for obj in enabled_objects:
+                try:
+                    removed_uv_or_vcol = False
+                    
+                    # Remove projection UV map
+                    if common.remove_uv_layer(obj, uv_name):
+                        removed_uv_or_vcol = True
+                        log(f"  {obj.name}: Removed UV map '{uv_name}'")
+                            
+                    # Remove vertex color layer
+                    if common.remove_vertex_color_layer(obj, vcol_name):
+                        removed_uv_or_vcol = True
+                        log(f"  {obj.name}: Removed vertex color '{vcol_name}'")
+                    
+                    if removed_uv_or_vcol:
+                        removed_count += 1
+                        log(f"  {obj.name}: ✓ Removed temporary data")
+                    else:
+                        log(f"  {obj.name}: No temporary data to remove")
+                    
+                except Exception as e:
+                    log(f"  {obj.name}: ✗ Error - {str(e)}")
+                    log.print_exc()
+            
+            log("="*50)
+            log(f"Removed temporary data from {removed_count}/{len(enabled_objects)} objects")
+            log("="*50 + "\n")
+            
+            if removed_count > 0:
+                self.report({'INFO'}, f"Removed temporary UVs/VCols from {removed_count} objects")
+            else:
+                self.report({'WARNING'}, "No temporary data found to remove")
+            
+            return {'FINISHED'}
+        finally:
+            log.flush()
 
 # =====================================================================
 # UI Panel
@@ -3386,12 +3520,13 @@ class CAMPROJPAINT_PT_main_panel(Panel):
         else:
             row = box.row()
             row.prop(settings, "projection_psd_file", text="")
+            psd_file_path = settings.projection_psd_file
+            has_psd = bool(psd_file_path)
             
             # Show PSD info if file is selected
-            if settings.projection_psd_file:
-                import os
-                if os.path.exists(settings.projection_psd_file):
-                    psd_info = psd_handler.get_psd_info(settings.projection_psd_file)
+            if has_psd:
+                if os.path.exists(psd_file_path):
+                    psd_info = psd_handler.get_psd_info(psd_file_path)
                     if psd_info:
                         box.label(text=f"Size: {psd_info['width']}x{psd_info['height']}", icon='IMAGE_DATA')
                         box.label(text=f"Layers: {psd_info['layer_count']}", icon='OUTLINER_DATA_GP_LAYER')
@@ -3402,25 +3537,22 @@ class CAMPROJPAINT_PT_main_panel(Panel):
             
             # File Watcher Toggle
             box.separator()
-            if psd_watcher.WATCHDOG_AVAILABLE:
-                row = box.row()
-                if psd_watcher.is_watching():
-                    row.operator("camprojpaint.toggle_auto_reload", text="Stop Auto-Reload", icon='PAUSE', depress=True)
-                else:
-                    row.operator("camprojpaint.toggle_auto_reload", text="Start Auto-Reload", icon='PLAY')
-                row.enabled = bool(settings.projection_psd_file)
+            row = box.row()
+            if psd_watcher.is_watching():
+                row.operator("camprojpaint.toggle_auto_reload", text="Stop Auto-Reload", icon='PAUSE', depress=True)
             else:
-                # Show info about watchdog if not available
+                row.operator("camprojpaint.toggle_auto_reload", text="Start Auto-Reload", icon='PLAY')
+            row.enabled = has_psd
+            if not psd_watcher.WATCHDOG_AVAILABLE:
+                # Auto-reload falls back to polling the file
                 row = box.row()
-                row.label(text="File Watcher: Not Installed", icon='ERROR')
-                row = box.row()
-                row.label(text="Install 'watchdog' for auto-reload", icon='INFO')
+                row.label(text="Install 'watchdog' for instant auto-reload", icon='INFO')
             
             # Reload button
             row = box.row()
             row.scale_y = 1.2
             row.operator("camprojpaint.reload_projection_image", icon='FILE_REFRESH', text="Reload PSD Layers")
-            row.enabled = bool(settings.projection_psd_file)
+            row.enabled = has_psd
             
             # Auto-map on reload toggle
             row = box.row()
@@ -3434,7 +3566,10 @@ class CAMPROJPAINT_PT_main_panel(Panel):
         
         # Show count of enabled objects
         enabled_objects = common.get_enabled_objects(context)
-        if enabled_objects:
+        enabled_set = set(enabled_objects)
+        has_enabled = bool(enabled_objects)
+        has_mapping, bake_ready, targets_ready = get_finalize_state(enabled_objects)
+        if has_enabled:
             preview_only_count = sum(1 for obj in enabled_objects if obj.cam_proj_paint.preview_only)
             if preview_only_count > 0:
                 box.label(text=f"{len(enabled_objects)} object(s) enabled ({preview_only_count} preview only)")
@@ -3447,7 +3582,7 @@ class CAMPROJPAINT_PT_main_panel(Panel):
                 box.label(text="Active is preview only", icon='HIDE_ON')
             else:
                 box.label(text="Active is being previewed", icon='CHECKMARK')
-        elif active_obj in enabled_objects:
+        elif active_obj in enabled_set:
             if active_obj.cam_proj_paint.preview_only:
                 box.label(text="Active is preview only", icon='HIDE_ON')
             else:
@@ -3471,7 +3606,7 @@ class CAMPROJPAINT_PT_main_panel(Panel):
         layout.separator()
         
         # Preserve UV Controls (Selected Objects)
-        if enabled_objects:
+        if has_enabled:
             box = layout.box()
             box.label(text="Preserve UV (Selected Objects):", icon='UV')
             
@@ -3480,9 +3615,7 @@ class CAMPROJPAINT_PT_main_panel(Panel):
             row.operator("camprojpaint.enable_preserve_uv", icon='CHECKBOX_HLT', text="Enable")
             row.operator("camprojpaint.disable_preserve_uv", icon='CHECKBOX_DEHLT', text="Disable")
         
-        # Count enabled objects
-        enabled_objects = common.get_enabled_objects(context)
-        if enabled_objects:
+        if has_enabled:
             box = layout.box()
             box.label(text="Mask (Selected Objects):", icon='MOD_MASK')
             
@@ -3509,19 +3642,19 @@ class CAMPROJPAINT_PT_main_panel(Panel):
         row = box.row()
         row.scale_y = 1.5
         row.operator("camprojpaint.setup_preview_materials", icon='SHADING_TEXTURE', text="Update Preview")
-        row.enabled = len(enabled_objects) > 0
+        row.enabled = has_enabled
         
         # Setup bake materials button
         row = box.row()
         row.scale_y = 1.5
         row.operator("camprojpaint.setup_bake_materials", icon='SHADING_RENDERED', text="Update Bake")
-        row.enabled = len(enabled_objects) > 0
+        row.enabled = has_enabled
         
         # Use projection frame toggle - for selected enabled objects
         active_obj = context.active_object
-        selected_enabled = [obj for obj in context.selected_objects if obj in enabled_objects]
+        selected_enabled = [obj for obj in context.selected_objects if obj in enabled_set]
         
-        if active_obj and active_obj in enabled_objects and selected_enabled:
+        if active_obj and active_obj in enabled_set and selected_enabled:
             row = box.row()
             row.prop(active_obj.cam_proj_paint, "use_projection_frame", text="Use Stored Projection Frame")
             
@@ -3563,7 +3696,6 @@ class CAMPROJPAINT_PT_main_panel(Panel):
             row.operator("camprojpaint.bake_projection", icon='RENDER_STILL', text="Bake with Cycles")
         
         # Check if bake is set up
-        bake_ready = has_bake_materials_ready(enabled_objects)
         row.enabled = bake_ready
         
         layout.separator()
@@ -3575,16 +3707,16 @@ class CAMPROJPAINT_PT_main_panel(Panel):
         row = box.row()
         row.scale_y = 1.5
         row.operator("camprojpaint.apply_baked_result", icon='CHECKMARK', text="Apply Baked Result")
-        # Check if any material has bake_target_texture (using helper function)
-        row.enabled = has_bake_targets_ready(enabled_objects)
+        # Check if any material has bake_target_texture
+        row.enabled = targets_ready
         
         row = box.row()
         row.operator("camprojpaint.remove_temp_materials", icon='TRASH', text="Remove Temp Mats/Texs")
-        row.enabled = len(enabled_objects) > 0
+        row.enabled = has_enabled
         
         row = box.row()
         row.operator("camprojpaint.remove_temp_uvs_vcols", icon='UV', text="Remove Temp UVs/VCols")
-        row.enabled = len(enabled_objects) > 0
+        row.enabled = has_enabled
         
         # PSD mapping management
         box.separator()
@@ -3592,7 +3724,6 @@ class CAMPROJPAINT_PT_main_panel(Panel):
         row = box.row()
         row.operator("camprojpaint.clear_psd_mapping", icon='UNLINKED', text="Clear PSD Mapping")
         # Enable if any object has material_data
-        has_mapping = any(len(obj.cam_proj_paint.material_data) > 0 for obj in enabled_objects)
         row.enabled = has_mapping
         
         layout.separator()
@@ -3610,13 +3741,13 @@ class CAMPROJPAINT_PT_object_panel(Panel):
         """Only show this panel for mesh objects"""
         return context.object and context.object.type == 'MESH'
 
-    def get_node_display_text(self, node_name, mat_data):
+    def get_node_display_text(self, node_name, original_mat_nodes):
         """
         Get display text for a texture node, showing label first then name in parentheses.
         
         Args:
             node_name: The texture node's name
-            mat_data: The material data containing the original material name
+            original_mat_nodes: Node collection of the original material, or None
             
         Returns:
             str: Display text in format "Label (node_name)" or just "node_name" if no label
@@ -3624,9 +3755,8 @@ class CAMPROJPAINT_PT_object_panel(Panel):
         node_label = node_name
         
         # Get the node from the original material to access its label
-        original_mat = bpy.data.materials.get(mat_data.original_material_name)
-        if original_mat and original_mat.use_nodes:
-            node = original_mat.node_tree.nodes.get(node_name)
+        if original_mat_nodes is not None:
+            node = original_mat_nodes.get(node_name)
             if node and node.label:
                 node_label = node.label
         
@@ -3681,7 +3811,8 @@ class CAMPROJPAINT_PT_object_panel(Panel):
         
         # Get selected enabled objects
         enabled_objects = common.get_enabled_objects(context)
-        selected_enabled = [o for o in context.selected_objects if o in enabled_objects]
+        enabled_set = set(enabled_objects)
+        selected_enabled = [o for o in context.selected_objects if o in enabled_set]
         
         row = box.row()
         row.prop(obj.cam_proj_paint, "use_projection_frame", text="Use Stored Frame")
@@ -3730,6 +3861,13 @@ class CAMPROJPAINT_PT_object_panel(Panel):
         
         layout.separator()
         
+        # Layer names for the "not found" check, read once for all materials
+        layer_names = None
+        psd_file_path = scene.cam_proj_paint.projection_psd_file
+        if psd_file_path and os.path.exists(psd_file_path):
+            psd_layers = psd_handler.get_psd_layer_list(psd_file_path)
+            layer_names = frozenset(layer_name for layer_name, is_group in psd_layers if not is_group)  # Exclude groups
+        
         # Iterate through materials
         for mat_data in obj.cam_proj_paint.material_data:
             mat_box = layout.box()
@@ -3743,12 +3881,9 @@ class CAMPROJPAINT_PT_object_panel(Panel):
                 mat_box.label(text="  No texture nodes found", icon='INFO')
                 continue
             
-            layer_names = None
-            psd_file_path = scene.cam_proj_paint.projection_psd_file
-            if psd_file_path and os.path.exists(psd_file_path):
-                layer_names = []
-                psd_layers = psd_handler.get_psd_layer_list(psd_file_path)
-                layer_names = [layer_name for layer_name, is_group in psd_layers if not is_group]  # Exclude groups
+            # Resolve the original material once for all its node labels
+            original_mat = bpy.data.materials.get(mat_data.original_material_name)
+            original_mat_nodes = original_mat.node_tree.nodes if original_mat and original_mat.use_nodes else None
             
             # List each texture node with PSD layer dropdown
             for tex_idx, tex_node_data in enumerate(mat_data.texture_nodes):
@@ -3757,7 +3892,7 @@ class CAMPROJPAINT_PT_object_panel(Panel):
                 
                 # Node name and image - show label first, then name in parentheses
                 row = node_box.row()
-                display_text = self.get_node_display_text(tex_node_data.node_name, mat_data)
+                display_text = self.get_node_display_text(tex_node_data.node_name, original_mat_nodes)
                 row.label(text=display_text, icon='NODE_TEXTURE')
                 
                 if tex_node_data.original_texture:
@@ -3794,7 +3929,7 @@ class CAMPROJPAINT_PT_object_panel(Panel):
                 #     row.label(text=f"  → Assigned: {tex_node_data.psd_layer_name}", icon='CHECKMARK')
 
 # Registration
-classes = [
+classes = (
     CAMPROJPAINT_TextureNodeData,  # Must be registered before MaterialData
     CAMPROJPAINT_MaterialData,  # Must be registered before ObjectSettings
     CAMPROJPAINT_SceneSettings,
@@ -3824,11 +3959,12 @@ classes = [
     CAMPROJPAINT_OT_remove_temp_uvs_vcols,
     CAMPROJPAINT_PT_object_panel,
     CAMPROJPAINT_PT_main_panel,
-]
+)
+
+register_classes, unregister_classes = bpy.utils.register_classes_factory(classes)
 
 def register():
-    for cls in classes:
-        bpy.utils.register_class(cls)
+    register_classes()
     
     # Add property groups
     bpy.types.Scene.cam_proj_paint = PointerProperty(type=CAMPROJPAINT_SceneSettings)
@@ -3837,23 +3973,33 @@ def register():
     # Add handlers
     bpy.app.handlers.depsgraph_update_post.append(on_projection_psd_reload)
     bpy.app.handlers.load_post.append(on_load_post)
+    bpy.app.handlers.save_pre.append(on_save_pre)
+    bpy.app.handlers.undo_post.append(on_undo_redo_post)
+    bpy.app.handlers.redo_post.append(on_undo_redo_post)
 
 def unregister():
     # Stop PSD file watching if active
     psd_watcher.stop_watching()
+    psd_handler.clear_psd_caches()
+    common.invalidate_enabled_objects()
     
     # Remove handlers
     if on_projection_psd_reload in bpy.app.handlers.depsgraph_update_post:
         bpy.app.handlers.depsgraph_update_post.remove(on_projection_psd_reload)
     if on_load_post in bpy.app.handlers.load_post:
         bpy.app.handlers.load_post.remove(on_load_post)
+    if on_save_pre in bpy.app.handlers.save_pre:
+        bpy.app.handlers.save_pre.remove(on_save_pre)
+    if on_undo_redo_post in bpy.app.handlers.undo_post:
+        bpy.app.handlers.undo_post.remove(on_undo_redo_post)
+    if on_undo_redo_post in bpy.app.handlers.redo_post:
+        bpy.app.handlers.redo_post.remove(on_undo_redo_post)
     
     # Remove property groups
     del bpy.types.Scene.cam_proj_paint
     del bpy.types.Object.cam_proj_paint
     
-    for cls in reversed(classes):
-        bpy.utils.unregister_class(cls)
+    unregister_classes()
 
 if __name__ == "__main__":
     register()
@@ -6,8 +6,20 @@ object management, and other common tasks.
 """
 
 import bpy
+import concurrent.futures
+import functools
+import os
+import sys
+import traceback
 import numpy
 
+# Optional JIT compiler for the pixel compositing kernel
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 # =============================================================================
 # Constants
 # =============================================================================
@@ -34,6 +46,12 @@ TEMP_BAKE_IMAGE_PREFIX = "TMP_BAKE_"
 # Temporary render filename for UV baking
 UV_BAKE_TEMP_RENDER_FILENAME = "uv_bake_temp_render.png"
 
+# Object types that show up in a render
+RENDERABLE_OBJECT_TYPES = {'MESH', 'CURVE', 'SURFACE', 'META', 'FONT', 'CURVES', 'POINTCLOUD', 'VOLUME'}
+
+# Scratch image the temporary render is reloaded into for each material
+UV_BAKE_SCRATCH_IMAGE_NAME = "TMP_BAKE_Scratch"
+
 # Node names for material setup
 NODE_NAME_PROJECTION_UV = "Projection_UV"
 NODE_NAME_PROJECTION_TEXTURE = "Projection_Texture"
@@ -47,10 +65,57 @@ NODE_NAME_ORIGINAL_UV = "Original_UV"
 NODE_NAME_BAKE_PRINCIPLED = "Bake_Principled"
 NODE_NAME_BAKE_TARGET = "Bake_Target"
 
+# Images with at least this many pixels are composited on several threads
+PARALLEL_COMPOSITE_MIN_PIXELS = 512 * 512
+
+# Editor areas that display textures and need a redraw after image updates
+REFRESH_AREA_TYPES = {'VIEW_3D', 'IMAGE_EDITOR'}
+
+# =============================================================================
+# Console Logging
+# =============================================================================
+
+def is_verbose_logging():
+    """
+    Check if verbose console output is enabled in the addon preferences.
+    
+    Returns:
+        True if enabled, False otherwise
+    """
+    try:
+        addon = bpy.context.preferences.addons.get(__package__)
+        return bool(addon and getattr(addon.preferences, 'verbose_logging', False))
+    except Exception:
+        return False
+
+
+class ConsoleLog:
+    """Buffer console lines and write them out in a single call"""
+    def __init__(self):
+        self.enabled = is_verbose_logging()
+        self.lines = []
+    
+    def __call__(self, message=""):
+        """Queue a line (dropped when verbose logging is off)"""
+        if self.enabled:
+            self.lines.append(message)
+    
+    def flush(self):
+        """Write all queued lines to stdout"""
+        if self.lines:
+            sys.stdout.write("\n".join(self.lines) + "\n")
+            self.lines.clear()
+    
+    def print_exc(self):
+        """Flush queued lines, then print the current exception's traceback"""
+        self.flush()
+        traceback.print_exc()
+
 # =============================================================================
 # String Utilities
 # =============================================================================
 
+@functools.lru_cache(maxsize=64)
 def node_name_to_label(node_name):
     """
     Convert a node name to a human-readable label.
@@ -79,29 +144,43 @@ def parse_comma_separated_list(text, lowercase=True, strip_whitespace=True):
         return []
     
     try:
-        items = [item for item in text.split(',') if item]
+        items = text.split(',')
         
+        # Single pass over the items, dropping empties at the end
+        if strip_whitespace and lowercase:
+            return [item for item in (part.strip().lower() for part in items) if item]
         if strip_whitespace:
-            items = [item.strip() for item in items]
-        
+            return [item for item in (part.strip() for part in items) if item]
         if lowercase:
-            items = [item.lower() for item in items]
-        
-        # Remove empty items
-        items = [item for item in items if item]
-        
-        return items
+            return [item.lower() for item in items if item]
+        return [item for item in items if item]
     except Exception as e:
         print(f"Failed to parse comma-separated list: {e}")
         return []
     
+@functools.lru_cache(maxsize=16)
+def get_prefix_tuple(text):
+    """
+    Parse a comma-separated prefix string into a lowercase tuple (cached).
+    
+    Args:
+        text: Comma-separated prefixes
+    
+    Returns:
+        Tuple of lowercase prefixes, for use with match_prefixes()
+    """
+    return tuple(parse_comma_separated_list(text, lowercase=True, strip_whitespace=True))
+
+
 def match_prefixes(string, prefixes):
     """
     Check if string starts with any of the given prefixes (case-insensitive).
     
     Args:
         string: String to check
-        prefixes: List of prefixes to match
+        prefixes: Tuple of lowercase prefixes (e.g. from get_prefix_tuple()),
+                  used as-is, or any other iterable of prefixes, which is
+                  lowercased on every call
 
     Returns:
         True if matches, False otherwise
@@ -110,8 +189,9 @@ def match_prefixes(string, prefixes):
         return False
     
     try:
-        string_lower = string.lower()
-        return any(string_lower.startswith(prefix.lower()) for prefix in prefixes)
+        if not isinstance(prefixes, tuple):
+            prefixes = tuple(prefix.lower() for prefix in prefixes)
+        return string.lower().startswith(prefixes)
     except Exception:
         return False
 
@@ -119,6 +199,60 @@ def match_prefixes(string, prefixes):
 # Image Operations
 # =============================================================================
 
+# Bulk pixel access (foreach_get/foreach_set on pixel arrays) is Blender 2.83+.
+# Probed once here so the compositing helpers can branch on a plain boolean.
+_USE_NUMPY_COMPOSITE = hasattr(getattr(bpy.types, 'bpy_prop_array', None), 'foreach_get')
+
+# Scratch float buffers for pixel readback, keyed by float count. Reused across
+# alpha_composite_images / copy_image_pixels calls so same-sized textures don't
+# reallocate; call release_pixel_buffers() once a batch is done to free the memory.
+# Each entry holds [src_buffer, dst_buffer], allocated on first use.
+_pixel_buffers = {}
+
+def _get_pixel_buffer_slot(count, slot):
+    """Get (allocating if needed) one scratch buffer slot for the given length."""
+    buffers = _pixel_buffers.get(count)
+    if buffers is None:
+        # Only keep one size around, textures can be large
+        _pixel_buffers.clear()
+        buffers = [None, None]
+        _pixel_buffers[count] = buffers
+    if buffers[slot] is None:
+        buffers[slot] = numpy.empty(count, dtype=numpy.float32)
+    return buffers[slot]
+
+
+def get_pixel_buffer(count):
+    """
+    Get a single reusable float32 scratch buffer of the given length.
+    
+    Args:
+        count: Number of floats in the buffer (width * height * 4)
+    
+    Returns:
+        1D numpy array (the src buffer of get_pixel_buffers())
+    """
+    return _get_pixel_buffer_slot(count, 0)
+
+
+def get_pixel_buffers(count):
+    """
+    Get a pair of reusable float32 scratch buffers of the given length.
+    
+    Args:
+        count: Number of floats per buffer (width * height * 4)
+    
+    Returns:
+        (src_buffer, dst_buffer) tuple of 1D numpy arrays
+    """
+    return _get_pixel_buffer_slot(count, 0), _get_pixel_buffer_slot(count, 1)
+
+
+def release_pixel_buffers():
+    """Free the scratch buffers held by get_pixel_buffers()."""
+    _pixel_buffers.clear()
+
+
 def convert_srgb_to_linear(pixels):
     """
     Convert sRGB pixel data to linear color space and premultiply alpha.
@@ -129,18 +263,16 @@ def convert_srgb_to_linear(pixels):
     Returns:
         Modified pixels array (same reference, modified in place)
     """
-    # sRGB to linear conversion for RGB channels
-    for i in range(3):
-        mask = pixels[:, :, i] <= 0.04045
-        pixels[:, :, i] = numpy.where(
-            mask,
-            pixels[:, :, i] / 12.92,
-            numpy.power((pixels[:, :, i] + 0.055) / 1.055, 2.4)
-        )
+    rgb = pixels[:, :, :3]
+    
+    # sRGB to linear conversion for all RGB channels at once; the power curve
+    # is only kept above the threshold, where its input is positive
+    with numpy.errstate(invalid='ignore'):
+        linear = numpy.power((rgb + 0.055) * (1.0 / 1.055), 2.4)
+    numpy.copyto(linear, rgb * (1.0 / 12.92), where=rgb <= 0.04045)
     
     # Premultiply RGB by alpha
-    alpha = pixels[:, :, 3:4]
-    pixels[:, :, :3] *= alpha
+    numpy.multiply(linear, pixels[:, :, 3:4], out=rgb)
     
     return pixels
 
@@ -155,23 +287,184 @@ def convert_linear_to_srgb(pixels):
     Returns:
         Modified pixels array (same reference, modified in place)
     """
+    rgb = pixels[:, :, :3]
+    
     # Unpremultiply RGB by alpha
     alpha = pixels[:, :, 3:4]
     safe_alpha = numpy.where(alpha > 0.00001, alpha, 1.0)
-    pixels[:, :, :3] /= safe_alpha
-    
-    # Linear to sRGB conversion for RGB channels
-    for i in range(3):
-        mask = pixels[:, :, i] <= 0.0031308
-        pixels[:, :, i] = numpy.where(
-            mask,
-            pixels[:, :, i] * 12.92,
-            1.055 * numpy.power(pixels[:, :, i], 1.0 / 2.4) - 0.055
-        )
+    rgb /= safe_alpha
+    
+    # Linear to sRGB conversion for all RGB channels at once; the power curve
+    # is only kept above the threshold, where its input is positive
+    with numpy.errstate(invalid='ignore'):
+        srgb = numpy.power(rgb, 1.0 / 2.4)
+    srgb *= 1.055
+    srgb -= 0.055
+    numpy.copyto(srgb, rgb * 12.92, where=rgb <= 0.0031308)
+    rgb[...] = srgb
     
     return pixels
 
 
+def composite_pixel_rows(src_pixels, dst_pixels, conversion=None):
+    """
+    Composite src_pixels over dst_pixels (numpy only, no Blender data access).
+    
+    Args:
+        src_pixels: Numpy array of shape (rows, width, 4), used as scratch (overwritten)
+        dst_pixels: Numpy array of shape (rows, width, 4), modified in place
+        conversion: Optional color conversion applied to src_pixels first
+    """
+    if conversion is not None:
+        conversion(src_pixels)
+    
+    # Extract channels (views, keep dimension for broadcasting)
+    src_rgb = src_pixels[:, :, :3]
+    src_alpha = src_pixels[:, :, 3:4]
+    dst_rgb = dst_pixels[:, :, :3]
+    dst_alpha = dst_pixels[:, :, 3:4]
+    
+    # Destination weight: dst_a * (1 - src_a), the only temporary
+    dst_weight = numpy.subtract(1.0, src_alpha)
+    dst_weight *= dst_alpha
+    
+    # Compute output RGB in place in the destination:
+    # out_rgb = (src_rgb * src_a + dst_rgb * dst_a * (1 - src_a)) / out_a
+    src_rgb *= src_alpha
+    dst_rgb *= dst_weight
+    dst_rgb += src_rgb
+    
+    # Compute output alpha in place: out_a = src_a + dst_a * (1 - src_a)
+    numpy.add(src_alpha, dst_weight, out=dst_alpha)
+    
+    # Avoid division by zero with a clamped reciprocal. Where out_alpha is 0
+    # both weights are 0, so the numerator (and the resulting RGB) is 0 too.
+    # src_alpha is no longer needed and holds the reciprocal
+    numpy.maximum(dst_alpha, 1e-30, out=src_alpha)
+    numpy.reciprocal(src_alpha, out=src_alpha)
+    dst_rgb *= src_alpha
+
+
+if NUMBA_AVAILABLE:
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def composite_pixels_jit(src, dst):
+        """
+        Fused single-pass version of composite_pixel_rows (compiled with Numba).
+        
+        Args:
+            src: Numpy float32 array of shape (pixel_count, 4)
+            dst: Numpy float32 array of shape (pixel_count, 4), modified in place
+        """
+        for i in numba.prange(src.shape[0]):
+            src_a = src[i, 3]
+            dst_weight = dst[i, 3] * (1.0 - src_a)
+            out_a = src_a + dst_weight
+            if out_a > 0.0:
+                for c in range(3):
+                    dst[i, c] = (src[i, c] * src_a + dst[i, c] * dst_weight) / out_a
+            else:
+                for c in range(3):
+                    dst[i, c] = 0.0
+            dst[i, 3] = out_a
+
+
+def get_composite_conversion(src_img, dst_img):
+    """
+    Get the color conversion needed to composite src_img onto dst_img.
+    
+    Args:
+        src_img: Source image
+        dst_img: Destination image
+    
+    Returns:
+        Conversion function for the source pixels, or None if bit depths match
+    """
+    if src_img.is_float == dst_img.is_float:
+        return None
+    if dst_img.is_float:
+        # Byte to float: sRGB to linear, then premultiply alpha
+        return convert_srgb_to_linear
+    # Float to byte: unpremultiply alpha, then linear to sRGB
+    return convert_linear_to_srgb
+
+
+def composite_pixels(src_pixels, dst_pixels, conversion=None):
+    """
+    Composite src_pixels over dst_pixels.
+    
+    Uses the Numba kernel when available, otherwise NumPy with large images
+    split across threads.
+    
+    Args:
+        src_pixels: Numpy array of shape (height, width, 4), may be modified by conversion
+        dst_pixels: Numpy array of shape (height, width, 4), modified in place
+        conversion: Optional color conversion applied to src_pixels first
+    """
+    if NUMBA_AVAILABLE:
+        if conversion is not None:
+            conversion(src_pixels)
+        composite_pixels_jit(src_pixels.reshape(-1, 4), dst_pixels.reshape(-1, 4))
+        return
+    
+    height, width = src_pixels.shape[:2]
+    workers = min(os.cpu_count() or 1, height)
+    if width * height >= PARALLEL_COMPOSITE_MIN_PIXELS and workers > 1:
+        # Split into row bands; numpy releases the GIL for the heavy math
+        # while all Blender data access stays on the main thread
+        bounds = numpy.linspace(0, height, workers + 1, dtype=int)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(composite_pixel_rows, src_pixels[start:end], dst_pixels[start:end], conversion)
+                for start, end in zip(bounds[:-1], bounds[1:])
+            ]
+            for future in futures:
+                future.result()
+    else:
+        composite_pixel_rows(src_pixels, dst_pixels, conversion)
+
+
+def _composite_python_fallback(src_img, dst_img):
+    """
+    Pure-Python per-pixel composite for builds without bulk pixel access.
+    
+    Args:
+        src_img: Source image to composite on top
+        dst_img: Destination image (modified in place)
+    
+    Returns:
+        True on success, False on failure
+    """
+    try:
+        src_pxs = list(src_img.pixels[:])
+        dst_pxs = list(dst_img.pixels[:])
+        
+        if len(src_pxs) != len(dst_pxs):
+            # Size mismatch, just overwrite
+            dst_img.pixels[:] = src_pxs
+            return True
+        
+        for pi in range(0, len(src_pxs), 4):
+            sr, sg, sb, sa = src_pxs[pi:pi+4]
+            dr, dg, db, da = dst_pxs[pi:pi+4]
+            
+            # Alpha composite: out = src + dst * (1 - src.a)
+            out_a = sa + da * (1.0 - sa)
+            if out_a > 0.0:
+                out_r = (sr * sa + dr * da * (1.0 - sa)) / out_a
+                out_g = (sg * sa + dg * da * (1.0 - sa)) / out_a
+                out_b = (sb * sa + db * da * (1.0 - sa)) / out_a
+            else:
+                out_r = out_g = out_b = 0.0
+            
+            dst_pxs[pi:pi+4] = [out_r, out_g, out_b, out_a]
+        
+        dst_img.pixels[:] = dst_pxs
+        return True
+    except Exception as e:
+        print(f"      Fallback compositing failed: {e}")
+        return False
+
+
 def alpha_composite_images(src_img, dst_img):
     """
     Composite src_img over dst_img using alpha blending (numpy optimized).
@@ -200,89 +493,112 @@ def alpha_composite_images(src_img, dst_img):
     if dst_img.size[0] != width or dst_img.size[1] != height:
         dst_img.scale(width, height)
     
-    # Check if bit depth conversion is needed
-    needs_conversion = src_img.is_float != dst_img.is_float
+    if not _USE_NUMPY_COMPOSITE:
+        return _composite_python_fallback(src_img, dst_img)
     
-    # Use numpy for efficient pixel operations (Blender 2.83+)
     try:
-        # Load pixels into numpy arrays
-        src_pixels = numpy.empty(width * height * 4, dtype=numpy.float32)
-        dst_pixels = numpy.empty(width * height * 4, dtype=numpy.float32)
+        # Load pixels into (reused) numpy arrays
+        src_buffer, dst_buffer = get_pixel_buffers(width * height * 4)
+        src_pixels = src_buffer.reshape((height, width, 4))
+        dst_pixels = dst_buffer.reshape((height, width, 4))
         
-        src_img.pixels.foreach_get(src_pixels)
-        dst_img.pixels.foreach_get(dst_pixels)
-        
-        # Reshape to (height, width, 4) for easier manipulation
-        src_pixels = src_pixels.reshape((height, width, 4))
-        dst_pixels = dst_pixels.reshape((height, width, 4))
+        src_img.pixels.foreach_get(src_buffer)
         
-        # Handle bit depth conversion if needed
-        if needs_conversion:
-            if dst_img.is_float and not src_img.is_float:
-                # Byte to float: sRGB to linear, then premultiply alpha
-                convert_srgb_to_linear(src_pixels)
-            else:
-                # Float to byte: unpremultiply alpha, then linear to sRGB
-                convert_linear_to_srgb(src_pixels)
-        
-        # Extract alpha channels
-        src_alpha = src_pixels[:, :, 3:4]  # Keep dimension for broadcasting
-        dst_alpha = dst_pixels[:, :, 3:4]
-        
-        # Compute output alpha: out_a = src_a + dst_a * (1 - src_a)
-        out_alpha = src_alpha + dst_alpha * (1.0 - src_alpha)
+        # Nothing to composite if the source is fully transparent
+        if not src_buffer[3::4].any():
+            return True
         
-        # Avoid division by zero
-        # Where out_alpha is 0, the color doesn't matter (fully transparent)
-        safe_out_alpha = numpy.where(out_alpha > 0.0, out_alpha, 1.0)
+        conversion = get_composite_conversion(src_img, dst_img)
         
-        # Compute output RGB: out_rgb = (src_rgb * src_a + dst_rgb * dst_a * (1 - src_a)) / out_a
-        out_rgb = (src_pixels[:, :, :3] * src_alpha + 
-                   dst_pixels[:, :, :3] * dst_alpha * (1.0 - src_alpha)) / safe_out_alpha
+        # A fully opaque source replaces the destination outright
+        if src_buffer[3::4].min() >= 1.0:
+            if conversion is not None:
+                conversion(src_pixels)
+            dst_img.pixels.foreach_set(src_buffer)
+            return True
         
-        # Where out_alpha is 0, set RGB to 0
-        out_rgb = numpy.where(out_alpha > 0.0, out_rgb, 0.0)
+        dst_img.pixels.foreach_get(dst_buffer)
         
-        # Combine RGB and alpha
-        dst_pixels[:, :, :3] = out_rgb
-        dst_pixels[:, :, 3:4] = out_alpha
+        # Handle bit depth conversion if needed
+        composite_pixels(src_pixels, dst_pixels, conversion)
         
         # Write back to image
-        dst_img.pixels.foreach_set(dst_pixels.ravel())
+        dst_img.pixels.foreach_set(dst_buffer)
         return True
         
     except Exception as e:
-        # Fallback to pixel-by-pixel if numpy fails
-        print(f"      Numpy compositing failed, using fallback: {e}")
-        try:
-            src_pxs = list(src_img.pixels[:])
-            dst_pxs = list(dst_img.pixels[:])
+        print(f"      Numpy compositing failed: {e}")
+        return False
+
+
+def alpha_composite_image_stack(src_imgs, dst_img):
+    """
+    Composite several images over dst_img in order, reading and writing dst_img once.
+    
+    Sources of differing sizes are composited one at a time instead.
+    
+    Args:
+        src_imgs: Source images, bottom to top
+        dst_img: Destination image (modified in place)
+    
+    Returns:
+        True on success, False on failure
+    """
+    src_imgs = [img for img in src_imgs if img]
+    if not src_imgs or not dst_img:
+        return False
+    
+    if len(src_imgs) == 1:
+        return alpha_composite_images(src_imgs[0], dst_img)
+    
+    width = src_imgs[0].size[0]
+    height = src_imgs[0].size[1]
+    
+    if not _USE_NUMPY_COMPOSITE or any(img.size[0] != width or img.size[1] != height for img in src_imgs):
+        return all([alpha_composite_images(img, dst_img) for img in src_imgs])
+    
+    # Resize destination if needed
+    if dst_img.size[0] != width or dst_img.size[1] != height:
+        dst_img.scale(width, height)
+    
+    try:
+        src_buffer, dst_buffer = get_pixel_buffers(width * height * 4)
+        src_pixels = src_buffer.reshape((height, width, 4))
+        dst_pixels = dst_buffer.reshape((height, width, 4))
+        dst_loaded = False
+        
+        for src_img in src_imgs:
+            src_img.pixels.foreach_get(src_buffer)
             
-            if len(src_pxs) == len(dst_pxs):
-                for pi in range(0, len(src_pxs), 4):
-                    sr, sg, sb, sa = src_pxs[pi:pi+4]
-                    dr, dg, db, da = dst_pxs[pi:pi+4]
-                    
-                    # Alpha composite: out = src + dst * (1 - src.a)
-                    out_a = sa + da * (1.0 - sa)
-                    if out_a > 0.0:
-                        out_r = (sr * sa + dr * da * (1.0 - sa)) / out_a
-                        out_g = (sg * sa + dg * da * (1.0 - sa)) / out_a
-                        out_b = (sb * sa + db * da * (1.0 - sa)) / out_a
-                    else:
-                        out_r = out_g = out_b = 0.0
-                    
-                    dst_pxs[pi:pi+4] = [out_r, out_g, out_b, out_a]
-                
-                dst_img.pixels[:] = dst_pxs
-                return True
-            else:
-                # Size mismatch, just overwrite
-                dst_img.pixels[:] = src_pxs
-                return True
-        except Exception as e2:
-            print(f"      Fallback compositing also failed: {e2}")
-            return False
+            # Nothing to composite if the source is fully transparent
+            if not src_buffer[3::4].any():
+                continue
+            
+            conversion = get_composite_conversion(src_img, dst_img)
+            
+            # A fully opaque source replaces everything below it
+            if src_buffer[3::4].min() >= 1.0:
+                if conversion is not None:
+                    conversion(src_pixels)
+                numpy.copyto(dst_buffer, src_buffer)
+                dst_loaded = True
+                continue
+            
+            if not dst_loaded:
+                dst_img.pixels.foreach_get(dst_buffer)
+                dst_loaded = True
+            
+            composite_pixels(src_pixels, dst_pixels, conversion)
+        
+        # Write back to image once
+        if dst_loaded:
+            dst_img.pixels.foreach_set(dst_buffer)
+        return True
+    
+    except Exception as e:
+        # Destination is untouched until the final write, so redo it image by image
+        print(f"      Stacked compositing failed, compositing one by one: {e}")
+        return all([alpha_composite_images(img, dst_img) for img in src_imgs])
 
 
 def copy_image_pixels(src_img, dst_img, resize_if_needed=True):
@@ -314,37 +630,36 @@ def copy_image_pixels(src_img, dst_img, resize_if_needed=True):
         if resize_if_needed and (dst_width != src_width or dst_height != src_height):
             dst_img.scale(src_width, src_height)
         
+        if not _USE_NUMPY_COMPOSITE:
+            # Direct pixel copy
+            dst_img.pixels[:] = src_img.pixels[:]
+            return True
+        
         # Check if bit depth conversion is needed
         needs_conversion = src_img.is_float != dst_img.is_float
         
-        # Use numpy for fast copy if available
-        try:
-            pixel_count = src_width * src_height * 4
-            src_pixels = numpy.empty(pixel_count, dtype=numpy.float32)
-            src_img.pixels.foreach_get(src_pixels)
-            
-            # Handle bit depth conversion if needed
-            if needs_conversion:
-                # Reshape for easier manipulation
-                src_pixels = src_pixels.reshape((src_height, src_width, 4))
-                
-                if dst_img.is_float and not src_img.is_float:
-                    # Byte to float: sRGB to linear, then premultiply alpha
-                    convert_srgb_to_linear(src_pixels)
-                else:
-                    # Float to byte: unpremultiply alpha, then linear to sRGB
-                    convert_linear_to_srgb(src_pixels)
-                
-                # Flatten back
-                src_pixels = src_pixels.ravel()
+        pixel_count = src_width * src_height * 4
+        src_pixels = get_pixel_buffer(pixel_count)
+        src_img.pixels.foreach_get(src_pixels)
+        
+        # Handle bit depth conversion if needed
+        if needs_conversion:
+            # Reshape for easier manipulation
+            src_pixels = src_pixels.reshape((src_height, src_width, 4))
             
-            dst_img.pixels.foreach_set(src_pixels)
-            return True
-        except Exception:
-            # Fallback to direct pixel copy
-            dst_img.pixels[:] = src_img.pixels[:]
-            return True
+            if dst_img.is_float and not src_img.is_float:
+                # Byte to float: sRGB to linear, then premultiply alpha
+                convert_srgb_to_linear(src_pixels)
+            else:
+                # Float to byte: unpremultiply alpha, then linear to sRGB
+                convert_linear_to_srgb(src_pixels)
             
+            # Flatten back
+            src_pixels = src_pixels.ravel()
+        
+        dst_img.pixels.foreach_set(src_pixels)
+        return True
+    
     except Exception as e:
         print(f"Failed to copy image pixels: {e}")
         return False
@@ -376,12 +691,13 @@ def create_image(name, width, height, alpha=True, color=(0.0, 0.0, 0.0, 0.0), fl
         
         # Set initial color if not default
         if color != (0.0, 0.0, 0.0, 0.0):
-            pixel_count = width * height
-            if alpha:
-                pixels = [color[0], color[1], color[2], color[3]] * pixel_count
+            channels = img.channels
+            if _USE_NUMPY_COMPOSITE:
+                pixels = numpy.empty(width * height * channels, dtype=numpy.float32)
+                pixels.reshape(-1, channels)[:] = color[:channels]
+                img.pixels.foreach_set(pixels)
             else:
-                pixels = [color[0], color[1], color[2]] * pixel_count
-            img.pixels[:] = pixels
+                img.pixels[:] = list(color[:channels]) * (width * height)
         
         return img
     except Exception as e:
@@ -456,6 +772,19 @@ def resize_image(image, width, height):
 # Object & Scene Utilities
 # =============================================================================
 
+def deselect_all_objects(context=None):
+    """
+    Deselect every selected object without the select_all operator.
+    
+    Args:
+        context: Blender context (defaults to bpy.context)
+    """
+    if context is None:
+        context = bpy.context
+    for obj in context.selected_objects:
+        obj.select_set(False)
+
+
 def store_selection_state(context):
     """
     Store current selection and active object state.
@@ -467,9 +796,12 @@ def store_selection_state(context):
         Dictionary with selection state or None on failure
     """
     try:
+        # Names rather than object references, so objects deleted in the
+        # meantime are simply skipped on restore
+        active_object = context.view_layer.objects.active
         return {
-            'selected_objects': context.selected_objects.copy() if context.selected_objects else [],
-            'active_object': context.view_layer.objects.active,
+            'selected_objects': [obj.name for obj in context.selected_objects],
+            'active_object': active_object.name if active_object else None,
             'mode': context.mode
         }
     except Exception as e:
@@ -492,28 +824,35 @@ def restore_selection_state(context, state):
         return False
     
     try:
-        # Deselect all first
-        try:
-            bpy.ops.object.select_all(action='DESELECT')
-        except Exception:
-            pass
+        objects = bpy.data.objects
         
-        # Restore selection
-        for obj in state.get('selected_objects', []):
+        # Deselect only what is currently selected (avoids the select_all operator)
+        for obj in context.selected_objects:
             try:
-                obj.select_set(True)
+                obj.select_set(False)
             except Exception:
                 pass
         
+        # Restore selection
+        for obj_name in state.get('selected_objects', []):
+            obj = objects.get(obj_name)
+            if obj:
+                try:
+                    obj.select_set(True)
+                except Exception:
+                    pass
+        
         # Restore active object
+        active_name = state.get('active_object')
+        active_object = objects.get(active_name) if active_name else None
         try:
-            context.view_layer.objects.active = state.get('active_object')
+            context.view_layer.objects.active = active_object
         except Exception:
             pass
         
         # Restore mode
         original_mode = state.get('mode')
-        if original_mode and original_mode != 'OBJECT' and state.get('active_object'):
+        if original_mode and original_mode != 'OBJECT' and active_object:
             try:
                 bpy.ops.object.mode_set(mode=original_mode)
             except Exception:
@@ -548,6 +887,30 @@ def ensure_object_mode(context):
 # Material & Node Utilities
 # =============================================================================
 
+def object_has_material_suffix(obj, suffix):
+    """
+    Check if any material assigned to the object's slots ends with suffix.
+    
+    Args:
+        obj: Object to check
+        suffix: Material name suffix to look for
+    
+    Returns:
+        True on the first matching slot, False otherwise
+    """
+    if not obj:
+        return False
+    
+    try:
+        return any(
+            slot.material and slot.material.name.endswith(suffix)
+            for slot in obj.material_slots
+        )
+    except Exception as e:
+        print(f"Failed to check material slots: {e}")
+        return False
+
+
 def find_image_texture_node(material, prefix=None):
     """
     Find image texture node in material, optionally by name prefix.
@@ -613,11 +976,7 @@ def find_all_image_texture_nodes(material):
         return []
     
     try:
-        texture_nodes = []
-        for node in material.node_tree.nodes:
-            if node.type == 'TEX_IMAGE':
-                texture_nodes.append(node)
-        return texture_nodes
+        return [node for node in material.node_tree.nodes if node.type == 'TEX_IMAGE']
     except Exception as e:
         print(f"Failed to find image texture nodes: {e}")
         return []
@@ -640,8 +999,10 @@ def remove_nodes_by_name(material, node_names):
     removed_count = 0
     try:
         nodes = material.node_tree.nodes
+        # One pass over the node collection; nodes.get() scans it per name
+        nodes_by_name = {node.name: node for node in nodes}
         for node_name in node_names:
-            node = nodes.get(node_name)
+            node = nodes_by_name.pop(node_name, None)
             if node:
                 nodes.remove(node)
                 removed_count += 1
@@ -698,9 +1059,10 @@ def remove_uv_layer(obj, uv_name):
         return False
     
     try:
-        uv_layer = obj.data.uv_layers.get(uv_name)
+        uv_layers = obj.data.uv_layers
+        uv_layer = uv_layers.get(uv_name)
         if uv_layer:
-            obj.data.uv_layers.remove(uv_layer)
+            uv_layers.remove(uv_layer)
             return True
         return False
     except Exception as e:
@@ -771,9 +1133,10 @@ def remove_vertex_color_layer(obj, vcol_name):
         return False
     
     try:
-        vcol = obj.data.vertex_colors.get(vcol_name)
+        vertex_colors = obj.data.vertex_colors
+        vcol = vertex_colors.get(vcol_name)
         if vcol:
-            obj.data.vertex_colors.remove(vcol)
+            vertex_colors.remove(vcol)
             return True
         return False
     except Exception as e:
@@ -871,6 +1234,30 @@ def remove_collection(collection):
         print(f"Failed to remove collection: {e}")
         return False
 
+
+def remove_ids(ids, remove_one):
+    """
+    Remove several datablocks at once with bpy.data.batch_remove.
+    
+    Args:
+        ids: Iterable of ID datablocks (None entries are ignored)
+        remove_one: Single-datablock remover used if the batch call fails
+                    (e.g. remove_object or remove_image)
+    
+    Returns:
+        Number of datablocks removed
+    """
+    ids = [id_block for id_block in ids if id_block]
+    if not ids:
+        return 0
+    
+    try:
+        bpy.data.batch_remove(ids=ids)
+        return len(ids)
+    except Exception as e:
+        print(f"Batch remove failed, removing individually: {e}")
+        return sum(1 for id_block in ids if remove_one(id_block))
+
 # =============================================================================
 # Validation & Polling
 # =============================================================================
@@ -890,9 +1277,7 @@ def is_valid_mesh_object(obj):
     
     try:
         # Check if mesh has polygons (faces)
-        if not hasattr(obj.data, 'polygons') or len(obj.data.polygons) == 0:
-            return False
-        return True
+        return bool(obj.data.polygons)
     except Exception:
         return False
 
@@ -981,7 +1366,7 @@ def get_viewport_shading_type(context):
 
 def refresh_viewport(context):
     """
-    Force viewport refresh.
+    Force viewport refresh of 3D viewports and image editors.
     
     Args:
         context: Blender context
@@ -991,7 +1376,7 @@ def refresh_viewport(context):
     """
     try:
         for area in context.screen.areas:
-            if area.type == 'VIEW_3D':
+            if area.type in REFRESH_AREA_TYPES:
                 area.tag_redraw()
         return True
     except Exception as e:
@@ -1005,6 +1390,12 @@ def refresh_viewport(context):
 
 class RenderSettings:
     """Store and restore render settings"""
+    __slots__ = (
+        'engine', 'resolution_x', 'resolution_y', 'view_transform',
+        'film_transparent', 'eevee_taa_samples', 'camera',
+        'file_format', 'color_mode', 'color_depth', 'compression',
+    )
+    
     def __init__(self):
         self.engine = None
         self.resolution_x = None
@@ -1013,6 +1404,10 @@ class RenderSettings:
         self.film_transparent = None
         self.eevee_taa_samples = None
         self.camera = None
+        self.file_format = None
+        self.color_mode = None
+        self.color_depth = None
+        self.compression = None
     
     def store(self, scene):
         """Store current render settings"""
@@ -1023,6 +1418,11 @@ class RenderSettings:
         self.film_transparent = scene.render.film_transparent
         self.eevee_taa_samples = scene.eevee.taa_render_samples
         self.camera = scene.camera
+        image_settings = scene.render.image_settings
+        self.file_format = image_settings.file_format
+        self.color_mode = image_settings.color_mode
+        self.color_depth = image_settings.color_depth
+        self.compression = image_settings.compression
         print("  Stored original render settings")
     
     def restore(self, scene):
@@ -1034,6 +1434,11 @@ class RenderSettings:
         scene.render.film_transparent = self.film_transparent
         scene.eevee.taa_render_samples = self.eevee_taa_samples
         scene.camera = self.camera
+        image_settings = scene.render.image_settings
+        image_settings.file_format = self.file_format
+        image_settings.color_mode = self.color_mode
+        image_settings.color_depth = self.color_depth
+        image_settings.compression = self.compression
         print("  Restored original render settings")
 
 
@@ -1081,10 +1486,23 @@ def switch_to_camera_view(context):
 # Camera & Visibility Utilities
 # =============================================================================
 
+# Last get_enabled_objects() result, reused until invalidate_enabled_objects()
+_enabled_objects_cache = {'stamp': 0, 'key': None, 'objects': []}
+
+def invalidate_enabled_objects():
+    """Force the next get_enabled_objects() call to rescan the scene."""
+    _enabled_objects_cache['stamp'] += 1
+    _enabled_objects_cache['key'] = None
+    _enabled_objects_cache['objects'] = []
+
+
 def get_enabled_objects(context, property_name='cam_proj_paint', enabled_attr='enabled'):
     """
     Return a list of objects that have a specific property enabled.
     
+    The result is cached until invalidate_enabled_objects() is called
+    (after depsgraph updates, file loads and enabled state changes).
+    
     Args:
         context: Blender context
         property_name: Name of the property group on the object (default: 'cam_proj_paint')
@@ -1095,16 +1513,87 @@ def get_enabled_objects(context, property_name='cam_proj_paint', enabled_attr='e
     """
     enabled_objects = []
     try:
-        for obj in context.scene.objects:
+        scene = context.scene
+        key = (scene.as_pointer(), property_name, enabled_attr, _enabled_objects_cache['stamp'])
+        if _enabled_objects_cache['key'] == key:
+            return list(_enabled_objects_cache['objects'])
+        
+        for obj in scene.objects:
             prop_group = getattr(obj, property_name, None)
             if prop_group and getattr(prop_group, enabled_attr, False):
                 enabled_objects.append(obj)
+        
+        _enabled_objects_cache['key'] = key
+        _enabled_objects_cache['objects'] = list(enabled_objects)
     except Exception as e:
         print(f"Failed to get enabled objects: {e}")
     
     return enabled_objects
 
 
+def get_camera_frustum_planes(scene, camera):
+    """
+    Get the camera's view frustum as planes in world space.
+    
+    A world-space point p is in view when planes @ (p, 1) has a positive first
+    entry and no negative entries. This matches bpy_extras'
+    world_to_camera_view() giving 0 <= x, y <= 1 and z > 0, without the
+    per-point perspective divide.
+    
+    Args:
+        scene: Scene (for render aspect / sensor fit)
+        camera: Camera object
+    
+    Returns:
+        Numpy array of shape (5, 4): near, left, right, bottom, top planes
+    """
+    cam_data = camera.data
+    frame = cam_data.view_frame(scene=scene)
+    min_x, max_x = frame[2].x, frame[1].x
+    min_y, max_y = frame[1].y, frame[0].y
+    
+    # Rows act on camera-local (x, y, z, 1); the camera looks down -z
+    if cam_data.type == 'ORTHO':
+        planes = [
+            [0.0, 0.0, -1.0, 0.0],
+            [1.0, 0.0, 0.0, -min_x],
+            [-1.0, 0.0, 0.0, max_x],
+            [0.0, 1.0, 0.0, -min_y],
+            [0.0, -1.0, 0.0, max_y],
+        ]
+    else:
+        # x / depth must lie between the frame edges at the frame's distance
+        dist = -frame[0].z
+        planes = [
+            [0.0, 0.0, -1.0, 0.0],
+            [dist, 0.0, min_x, 0.0],
+            [-dist, 0.0, -max_x, 0.0],
+            [0.0, dist, min_y, 0.0],
+            [0.0, -dist, -max_y, 0.0],
+        ]
+    
+    world_to_camera = numpy.array(camera.matrix_world.normalized().inverted())
+    return numpy.array(planes) @ world_to_camera
+
+
+def any_point_in_frustum(planes, points):
+    """
+    Check whether any point lies inside a camera frustum.
+    
+    Args:
+        planes: Frustum planes in the points' space, i.e.
+                get_camera_frustum_planes() @ the points' local-to-world matrix
+        points: Numpy array of shape (n, 3)
+    
+    Returns:
+        True if at least one point is in view
+    """
+    distances = points @ planes[:, :3].T
+    distances += planes[:, 3]
+    in_view = (distances[:, 0] > 0.0) & (distances[:, 1:] >= 0.0).all(axis=1)
+    return bool(in_view.any())
+
+
 def get_visible_objects_from_camera(context, camera=None):
     """
     Return a list of mesh objects whose bounding-box corners or vertices are
@@ -1121,14 +1610,17 @@ def get_visible_objects_from_camera(context, camera=None):
     Returns:
         List of visible mesh objects
     """
-    from bpy_extras.object_utils import world_to_camera_view
-    from mathutils import Vector
-    
     cam = camera or context.scene.camera
     if not cam:
         return []
+    
+    try:
+        planes = get_camera_frustum_planes(context.scene, cam)
+    except Exception as e:
+        print(f"Failed to get camera frustum: {e}")
+        return []
 
-    visible = []
+    candidates = []
     for obj in context.scene.objects:
         # Skip meshes with no faces (e.g. loose verts/edges). Many operators
         # (UV projection, data_transfer, etc.) require at least one face and
@@ -1137,49 +1629,53 @@ def get_visible_objects_from_camera(context, camera=None):
             continue
         if obj.hide_get() or obj.hide_viewport:
             continue
+        candidates.append(obj)
+    
+    if not candidates:
+        return []
 
-        # Robust visibility test: first test all bounding-box corners, then
-        # sample mesh vertices if needed. Using the bbox center misses objects
-        # that are partially in-frame (e.g. half-in-frame), so checking corners
-        # and sampled vertices gives much better coverage while remaining
-        # reasonably fast.
-        try:
-            bbox_world = [obj.matrix_world @ Vector(c) for c in obj.bound_box]
-        except Exception:
-            bbox_world = [obj.matrix_world.translation]
-
-        in_view = False
-
-        # 1) Check bounding box corners
-        for p in bbox_world:
-            try:
-                co_ndc = world_to_camera_view(context.scene, cam, p)
-                if 0.0 <= co_ndc.x <= 1.0 and 0.0 <= co_ndc.y <= 1.0 and co_ndc.z > 0.0:
-                    in_view = True
-                    break
-            except Exception:
-                # ignore individual projection failures
-                continue
+    # Robust visibility test: first test all bounding-box corners, then
+    # sample mesh vertices if needed. Using the bbox center misses objects
+    # that are partially in-frame (e.g. half-in-frame), so checking corners
+    # and sampled vertices gives much better coverage while remaining
+    # reasonably fast.
+    try:
+        # 1) Check bounding box corners of all objects in one batch
+        corners = numpy.array([obj.bound_box for obj in candidates], dtype=numpy.float64)
+        matrices = numpy.array([obj.matrix_world for obj in candidates], dtype=numpy.float64)
+        local_planes = planes @ matrices
+        distances = numpy.einsum('nci,npi->ncp', corners, local_planes[:, :, :3])
+        distances += local_planes[:, numpy.newaxis, :, 3]
+        
+        corner_in_view = ((distances[:, :, 0] > 0.0) & (distances[:, :, 1:] >= 0.0).all(axis=2)).any(axis=1)
+        
+        # Vertices lie inside the bounding box, so a box entirely behind one
+        # frustum plane can't have a visible vertex either
+        culled = (distances[:, :, 0] <= 0.0).all(axis=1) | (distances[:, :, 1:] < 0.0).all(axis=1).any(axis=1)
+    except Exception as e:
+        print(f"Batched bounding box test failed: {e}")
+        local_planes = None
+        corner_in_view = numpy.zeros(len(candidates), dtype=bool)
+        culled = corner_in_view
 
+    visible = []
+    for i, (obj, in_view, is_culled) in enumerate(zip(candidates, corner_in_view, culled)):
         # 2) If no bbox corner is inside the view, sample some vertices
         # (use up to a reasonable limit) to detect partially visible meshes
-        if not in_view:
+        if not in_view and not is_culled:
             try:
-                verts = getattr(obj.data, 'vertices', None)
-                if verts and len(verts) > 0:
+                verts = obj.data.vertices
+                total = len(verts)
+                if total:
                     max_samples = 64
-                    total = len(verts)
                     step = max(1, total // max_samples)
-                    for i in range(0, total, step):
-                        v = verts[i]
-                        p = obj.matrix_world @ v.co
-                        try:
-                            co_ndc = world_to_camera_view(context.scene, cam, p)
-                            if 0.0 <= co_ndc.x <= 1.0 and 0.0 <= co_ndc.y <= 1.0 and co_ndc.z > 0.0:
-                                in_view = True
-                                break
-                        except Exception:
-                            continue
+                    # Read just the sampled vertices; foreach_get would copy them all
+                    samples = numpy.array([verts[j].co for j in range(0, total, step)], dtype=numpy.float64)
+                    if local_planes is not None:
+                        obj_planes = local_planes[i]
+                    else:
+                        obj_planes = planes @ numpy.array(obj.matrix_world)
+                    in_view = any_point_in_frustum(obj_planes, samples)
             except Exception:
                 # sampling failed; fall back to skipping the object
                 in_view = False
@@ -1206,88 +1702,82 @@ def calculate_camera_visibility(obj, camera, fill=None, vcol_name=None):
     Returns:
         True on success, False on failure
     """
-    import bmesh
-    
     if vcol_name is None:
         vcol_name = PROJECTION_VIS_VCOL_NAME
     
     try:
-        bm = bmesh.new()
-        bm.from_mesh(obj.data)
-        bm.faces.ensure_lookup_table()
+        mesh = obj.data
+        polygons = mesh.polygons
+        n_verts = len(mesh.vertices)
+        n_polys = len(polygons)
+        n_loops = len(mesh.loops)
         
-        camera_pos = None
-        if camera:
-            camera_pos = camera.matrix_world.translation
+        loop_verts = numpy.empty(n_loops, dtype=numpy.int32)
+        mesh.loops.foreach_get('vertex_index', loop_verts)
+        loop_starts = numpy.empty(n_polys, dtype=numpy.int32)
+        polygons.foreach_get('loop_start', loop_starts)
+        loop_totals = numpy.empty(n_polys, dtype=numpy.int32)
+        polygons.foreach_get('loop_total', loop_totals)
+        
+        # Loop indices grouped face by face, with each face's slice start
+        face_starts = numpy.zeros(n_polys, dtype=numpy.int64)
+        numpy.cumsum(loop_totals[:-1], out=face_starts[1:])
+        face_loops = numpy.arange(loop_totals.sum()) + numpy.repeat(loop_starts - face_starts, loop_totals)
+        face_loop_polys = numpy.repeat(numpy.arange(n_polys), loop_totals)
 
         # Per-face visibility determined only by face normal (no occlusion/raycasts)
-        face_visibility = {}
-
-        for face in bm.faces:
-            try:
-                # Sample points: face center + each vertex position (world space)
-                samples = []
-                face_center_local = face.calc_center_median()
-                face_center_world = obj.matrix_world @ face_center_local
-                samples.append(face_center_world)
-                for v in face.verts:
-                    samples.append(obj.matrix_world @ v.co)
-
-                face_normal_world = (obj.matrix_world.to_3x3() @ face.normal).normalized()
-
-                sample_vis_max = 0.0
-                sample_count = 0
-
-                for sample_pt in samples:
-                    if fill is None:
-                        to_camera = camera_pos - sample_pt
-                        if to_camera.length == 0.0:
-                            facing = True
-                        else:
-                            facing = face_normal_world.dot(to_camera.normalized()) > 0.0
-                        sample_vis = 1.0 if facing else 0.0
-                    else:
-                        sample_vis = min(max(fill, 0.0), 1.0)
-
-                    if sample_vis > sample_vis_max:
-                        sample_vis_max = sample_vis
-                    sample_count += 1
-
-                face_visibility[face.index] = sample_vis_max if sample_count > 0 else 0.0
-            except Exception:
-                face_visibility[face.index] = 0.0
+        if fill is not None:
+            face_visibility = numpy.full(n_polys, min(max(fill, 0.0), 1.0), dtype=numpy.float32)
+        elif camera and n_polys:
+            camera_pos = numpy.array(camera.matrix_world.translation)
+            matrix_world = numpy.array(obj.matrix_world)
+            rotation = matrix_world[:3, :3]
+            translation = matrix_world[:3, 3]
+            
+            coords = numpy.empty(n_verts * 3, dtype=numpy.float32)
+            mesh.vertices.foreach_get('co', coords)
+            normals = numpy.empty(n_polys * 3, dtype=numpy.float32)
+            polygons.foreach_get('normal', normals)
+            centers = numpy.empty(n_polys * 3, dtype=numpy.float32)
+            polygons.foreach_get('center', centers)
+            
+            # World-space face normals, face centers and vertex positions
+            normals_world = normals.reshape((n_polys, 3)) @ rotation.T
+            centers_world = centers.reshape((n_polys, 3)) @ rotation.T + translation
+            coords_world = coords.reshape((n_verts, 3)) @ rotation.T + translation
+            
+            # Sample points: face center + each vertex position. A face is
+            # visible if its normal faces the camera from any sample point
+            # (a sample exactly at the camera counts as facing)
+            to_camera = camera_pos - centers_world
+            facing = numpy.einsum('ij,ij->i', normals_world, to_camera) > 0.0
+            facing |= ~to_camera.any(axis=1)
+            
+            to_camera = camera_pos - coords_world[loop_verts[face_loops]]
+            loop_facing = numpy.einsum('ij,ij->i', normals_world[face_loop_polys], to_camera) > 0.0
+            loop_facing |= ~to_camera.any(axis=1)
+            facing |= numpy.logical_or.reduceat(loop_facing, face_starts)
+            
+            face_visibility = facing.astype(numpy.float32)
+        else:
+            face_visibility = numpy.zeros(n_polys, dtype=numpy.float32)
 
         # Per-vertex visibility: use the maximum visibility of connected faces
-        vertex_visibility = {}
-        for vert in bm.verts:
-            connected = vert.link_faces
-            if connected:
-                maxv = max(face_visibility.get(f.index, 0.0) for f in connected)
-                vertex_visibility[vert.index] = maxv
-            else:
-                vertex_visibility[vert.index] = 0.0
+        vertex_visibility = numpy.zeros(n_verts, dtype=numpy.float32)
+        numpy.maximum.at(vertex_visibility, loop_verts[face_loops], face_visibility[face_loop_polys])
 
         # Ensure vertex color layer exists
         vcol = ensure_vertex_color_layer(obj, vcol_name)
         if not vcol:
-            bm.free()
             return False
 
         # Write per-loop colors
-        for poly in obj.data.polygons:
-            for loop_idx in poly.loop_indices:
-                loop = obj.data.loops[loop_idx]
-                vert_idx = loop.vertex_index
-                vis = vertex_visibility.get(vert_idx, 0.0)
-                # RGBA: store visibility in RGB channels; alpha kept at 1.0
-                vcol.data[loop_idx].color = (vis, vis, vis, 1.0)
-
-        bm.free()
+        # RGBA: store visibility in RGB channels; alpha kept at 1.0
+        colors = numpy.ones((n_loops, 4), dtype=numpy.float32)
+        colors[:, :3] = vertex_visibility[loop_verts, numpy.newaxis]
+        vcol.data.foreach_set('color', colors.ravel())
+
         return True
     except Exception as e:
         print(f"Failed to calculate camera visibility: {e}")
-        try:
-            bm.free()
-        except Exception:
-            pass
         return False
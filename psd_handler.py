@@ -6,6 +6,8 @@ and convert them to Blender Image datablocks for use in projection workflows.
 """
 
 import bpy
+import collections
+import concurrent.futures
 import os
 import numpy as np
 from PIL import Image
@@ -29,10 +31,86 @@ def is_psd_available():
     return PSD_AVAILABLE
 
 
+# Parsed results keyed by file path: {path: (file_stamp, result)}
+_psd_layer_list_cache = {}
+_psd_info_cache = {}
+
+
+def get_file_stamp(filepath):
+    """
+    Get a stamp that changes whenever the file is modified.
+    
+    Args:
+        filepath: Path to file
+    
+    Returns:
+        tuple: (mtime_ns, size), or None if the file cannot be accessed
+    """
+    try:
+        stat = os.stat(filepath)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def clear_psd_caches():
+    """Drop all cached PSD layer lists, file info, parsed files and buffers."""
+    _psd_layer_list_cache.clear()
+    _psd_info_cache.clear()
+    release_open_psd_files()
+    release_pixel_buffer()
+    _images_pending_pack.clear()
+    if bpy.app.timers.is_registered(pack_pending_images_timer):
+        bpy.app.timers.unregister(pack_pending_images_timer)
+
+
+# Parsed PSD files keyed by path: {path: (file_stamp, PSDImage)}. Only the
+# current version of each file is kept; release_open_psd_files() frees them
+_open_psd_cache = {}
+
+
+def open_psd(psd_filepath):
+    """
+    Open a PSD file, reusing the parsed file while it is unchanged on disk.
+    
+    Args:
+        psd_filepath: Path to PSD file
+    
+    Returns:
+        PSDImage (shared, treat as read-only)
+    """
+    stamp = get_file_stamp(psd_filepath)
+    if stamp is None:
+        return PSDImage.open(psd_filepath)
+    
+    cached = _open_psd_cache.pop(psd_filepath, None)
+    if cached:
+        if cached[0] == stamp:
+            _open_psd_cache[psd_filepath] = cached
+            return cached[1]
+        # The file changed: drop the stale parse (and its layer index) first
+        if _layer_index_cache['psd'] is cached[1]:
+            _layer_index_cache['psd'] = None
+            _layer_index_cache['index'] = None
+    
+    psd = PSDImage.open(psd_filepath)
+    _open_psd_cache[psd_filepath] = (stamp, psd)
+    return psd
+
+
+def release_open_psd_files():
+    """Free the parsed PSD files held by open_psd() and their layer index."""
+    _open_psd_cache.clear()
+    _layer_index_cache['psd'] = None
+    _layer_index_cache['index'] = None
+
+
 def get_psd_layer_list(psd_filepath):
     """
     Get list of layer names from PSD file without extracting pixel data.
     
+    Results are cached until the file's modification time or size changes.
+    
     Args:
         psd_filepath: Path to PSD file
     
@@ -44,12 +122,17 @@ def get_psd_layer_list(psd_filepath):
         print("psd-tools not available")
         return []
     
-    if not os.path.exists(psd_filepath):
+    stamp = get_file_stamp(psd_filepath)
+    if stamp is None:
         print(f"PSD file not found: {psd_filepath}")
         return []
     
+    cached = _psd_layer_list_cache.get(psd_filepath)
+    if cached and cached[0] == stamp:
+        return list(cached[1])
+    
     try:
-        psd = PSDImage.open(psd_filepath)
+        psd = open_psd(psd_filepath)
         layers = []
         
         def traverse_layers(layer_list, prefix=""):
@@ -69,14 +152,92 @@ def get_psd_layer_list(psd_filepath):
         traverse_layers(psd)
         
         # print(f"Found {len(layers)} layers in PSD file: {psd_filepath}")
-        return layers
+        _psd_layer_list_cache[psd_filepath] = (stamp, layers)
+        return list(layers)
         
     except Exception as e:
         print(f"Failed to read PSD layer list: {e}")
         return []
 
 
-def extract_single_layer(psd_filepath, layer_name, as_blender_image=True, image_name=None):
+def is_group_layer(layer):
+    """Check whether a psd-tools layer is a group that can be iterated."""
+    return hasattr(layer, 'is_group') and layer.is_group() and hasattr(layer, '__iter__')
+
+
+# Layer index of the most recently indexed PSDImage
+_layer_index_cache = {'psd': None, 'index': None}
+
+
+def get_layer_index(psd):
+    """
+    Get a flat index of all layers (including groups) by full path.
+    
+    Paths use "/" between group and layer names, e.g. "group/layer". If a
+    path occurs more than once, the first layer in document order is kept.
+    The index is reused while the same PSDImage is passed in.
+    
+    Args:
+        psd: Opened PSDImage
+    
+    Returns:
+        dict: {layer_path: layer}
+    """
+    if _layer_index_cache['psd'] is psd:
+        return _layer_index_cache['index']
+    
+    index = {}
+    stack = [("", iter(psd))]
+    while stack:
+        prefix, layers = stack[-1]
+        layer = next(layers, None)
+        if layer is None:
+            stack.pop()
+            continue
+        
+        full_path = prefix + layer.name
+        index.setdefault(full_path, layer)
+        if is_group_layer(layer):
+            stack.append((full_path + "/", iter(layer)))
+    
+    _layer_index_cache['psd'] = psd
+    _layer_index_cache['index'] = index
+    return index
+
+
+def get_pixel_layers(psd):
+    """
+    Get all non-group layers by full path.
+    
+    Unlike get_layer_index(), groups never shadow a layer, and if a path
+    occurs more than once, the last pixel layer in document order is kept.
+    
+    Args:
+        psd: Opened PSDImage
+    
+    Returns:
+        dict: {layer_path: layer}
+    """
+    pixel_layers = {}
+    stack = [("", iter(psd))]
+    while stack:
+        prefix, layers = stack[-1]
+        layer = next(layers, None)
+        if layer is None:
+            stack.pop()
+            continue
+        
+        full_path = prefix + layer.name
+        if hasattr(layer, 'is_group') and layer.is_group():
+            if hasattr(layer, '__iter__'):
+                stack.append((full_path + "/", iter(layer)))
+        else:
+            pixel_layers[full_path] = layer
+    
+    return pixel_layers
+
+
+def extract_single_layer(psd_filepath, layer_name, as_blender_image=True, image_name=None, psd=None, pack=True):
     """
     Extract a single layer from PSD file.
     
@@ -85,6 +246,8 @@ def extract_single_layer(psd_filepath, layer_name, as_blender_image=True, image_
         layer_name: Name of the layer to extract
         as_blender_image: If True, return as Blender Image datablock
         image_name: Optional name for the Blender image (default: layer_name)
+        psd: Optional already opened PSDImage for psd_filepath
+        pack: If False, defer repacking an already packed image (see pil_image_to_blender)
     
     Returns:
         bpy.types.Image if as_blender_image=True, PIL.Image otherwise
@@ -94,34 +257,16 @@ def extract_single_layer(psd_filepath, layer_name, as_blender_image=True, image_
         print("psd-tools not available")
         return None
     
-    if not os.path.exists(psd_filepath):
+    if psd is None and not os.path.exists(psd_filepath):
         print(f"PSD file not found: {psd_filepath}")
         return None
     
     try:
-        psd = PSDImage.open(psd_filepath)
+        if psd is None:
+            psd = open_psd(psd_filepath)
         
         # Find the layer by name (handles both simple names and paths like "group/layer")
-        target_layer = None
-        
-        def find_layer_by_path(layer_list, target_path, current_prefix=""):
-            """Recursively search for layer by full path"""
-            for layer in layer_list:
-                full_path = current_prefix + layer.name
-                
-                # Check if this is the target layer
-                if full_path == target_path:
-                    return layer
-                
-                # Check in groups
-                if hasattr(layer, 'is_group') and layer.is_group():
-                    if hasattr(layer, '__iter__'):
-                        found = find_layer_by_path(layer, target_path, current_prefix=full_path + "/")
-                        if found:
-                            return found
-            return None
-        
-        target_layer = find_layer_by_path(psd, layer_name)
+        target_layer = get_layer_index(psd).get(layer_name)
         
         if not target_layer:
             print(f"Layer '{layer_name}' not found in PSD file")
@@ -133,7 +278,7 @@ def extract_single_layer(psd_filepath, layer_name, as_blender_image=True, image_
             return None
         
         # Get layer opacity (0-255)
-        layer_opacity = getattr(target_layer, 'opacity', 255) / 255.0
+        layer_opacity = getattr(target_layer, 'opacity', 255)
         
         # Convert layer to PIL Image
         layer_image = target_layer.topil()
@@ -149,30 +294,45 @@ def extract_single_layer(psd_filepath, layer_name, as_blender_image=True, image_
         # Create full canvas-sized transparent image
         canvas_width = psd.width
         canvas_height = psd.height
-        full_image = Image.new('RGBA', (canvas_width, canvas_height), (0, 0, 0, 0))
+        full_image = np.zeros((canvas_height, canvas_width, 4), dtype=np.uint8)
         
-        # Paste the layer image at the correct position
+        # Copy the layer pixels into the canvas at the correct position
         if layer_image:
-            # Convert layer to RGBA if needed
-            if layer_image.mode != 'RGBA':
+            # Convert layer to RGBA if needed (RGB is copied as-is below)
+            if layer_image.mode not in ('RGBA', 'RGB'):
                 layer_image = layer_image.convert('RGBA')
             
-            # Apply layer opacity to alpha channel
-            if layer_opacity < 1.0:
-                # Convert to numpy array for efficient processing
-                layer_array = np.array(layer_image, dtype=np.float32)
-                # Multiply alpha channel by layer opacity
-                layer_array[:, :, 3] *= layer_opacity
-                # Convert back to PIL Image
-                layer_image = Image.fromarray(layer_array.astype(np.uint8), 'RGBA')
+            layer_array = np.asarray(layer_image, dtype=np.uint8)
+            layer_height, layer_width = layer_array.shape[:2]
+            
+            # Clip the layer to the canvas (layers may extend past its edges)
+            x0, y0 = max(left, 0), max(top, 0)
+            x1 = min(left + layer_width, canvas_width)
+            y1 = min(top + layer_height, canvas_height)
             
-            full_image.paste(layer_image, (left, top))
+            if x0 < x1 and y0 < y1:
+                region = full_image[y0:y1, x0:x1]
+                layer_region = layer_array[y0 - top:y1 - top, x0 - left:x1 - left]
+                
+                if layer_image.mode == 'RGB':
+                    # No alpha channel: the layer opacity is the alpha
+                    region[:, :, :3] = layer_region
+                    region[:, :, 3] = layer_opacity
+                else:
+                    region[...] = layer_region
+                    
+                    # Apply layer opacity to alpha channel (integer math, no float copy)
+                    if layer_opacity < 255:
+                        alpha = region[:, :, 3].astype(np.uint16)
+                        alpha *= layer_opacity
+                        alpha //= 255
+                        region[:, :, 3] = alpha
             
         if not as_blender_image:
-            return full_image
+            return Image.fromarray(full_image, 'RGBA')
         
         # Convert PIL Image to Blender Image
-        return pil_image_to_blender(full_image, image_name or layer_name)
+        return pil_image_to_blender(full_image, image_name or layer_name, pack=pack)
         
     except Exception as e:
         print(f"Failed to extract layer '{layer_name}': {e}")
@@ -200,35 +360,35 @@ def extract_psd_layers(psd_filepath, as_blender_images=True):
         return {}
     
     try:
-        psd = PSDImage.open(psd_filepath)
+        psd = open_psd(psd_filepath)
         layers = {}
         
-        def extract_from_list(layer_list, prefix=""):
-            """Recursively extract layers"""
-            for layer in layer_list:
-                layer_name = prefix + layer.name
-                
-                # Skip groups
-                if hasattr(layer, 'is_group') and layer.is_group():
-                    if hasattr(layer, '__iter__'):
-                        extract_from_list(layer, prefix=layer_name + "/")
-                    continue
+        def store_layer(layer_name, future):
+            """Convert one decoded layer on the calling thread"""
+            try:
+                pil_image = future.result()
                 
-                try:
-                    pil_image = layer.topil()
+                if as_blender_images:
+                    blender_image = pil_image_to_blender(pil_image, layer_name)
+                    if blender_image:
+                        layers[layer_name] = blender_image
+                else:
+                    layers[layer_name] = pil_image
                     
-                    if as_blender_images:
-                        blender_image = pil_image_to_blender(pil_image, layer_name)
-                        if blender_image:
-                            layers[layer_name] = blender_image
-                    else:
-                        layers[layer_name] = pil_image
-                        
-                except Exception as e:
-                    print(f"Failed to extract layer '{layer_name}': {e}")
-                    continue
-        
-        extract_from_list(psd)
+            except Exception as e:
+                print(f"Failed to extract layer '{layer_name}': {e}")
+        
+        # Decode ahead on worker threads, at most one layer per CPU in flight,
+        # and consume in document order so bpy.data stays on this thread
+        window = os.cpu_count() or 1
+        pending = collections.deque()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=window) as executor:
+            for layer_name, layer in get_pixel_layers(psd).items():
+                pending.append((layer_name, executor.submit(layer.topil)))
+                if len(pending) >= window:
+                    store_layer(*pending.popleft())
+            while pending:
+                store_layer(*pending.popleft())
         
         print(f"Extracted {len(layers)} layers from PSD file")
         return layers
@@ -236,25 +396,76 @@ def extract_psd_layers(psd_filepath, as_blender_images=True):
     except Exception as e:
         print(f"Failed to extract PSD layers: {e}")
         return {}
+    
+    finally:
+        release_open_psd_files()
+        release_pixel_buffer()
+
+
+# Scratch float buffer for set_image_pixels_rgba8, keyed by array shape.
+# Reused across the layers of one reload; call release_pixel_buffer() after
+_float_pixel_buffer = {}
+
+
+def release_pixel_buffer():
+    """Free the scratch buffer held by set_image_pixels_rgba8()."""
+    _float_pixel_buffer.clear()
+
+
+def set_image_pixels_rgba8(blender_image, pixels):
+    """
+    Write 8-bit RGBA pixels (top row first) into a Blender image.
+    
+    Scales to 0-1 and flips vertically (Blender images are stored
+    bottom-to-top) in a single pass into one float32 buffer.
+    
+    Args:
+        blender_image: Blender image, already sized to match
+        pixels: Numpy uint8 array of shape (height, width, 4)
+    """
+    buffer = _float_pixel_buffer.get(pixels.shape)
+    if buffer is None:
+        # Keep only one buffer; layers of one PSD all share the canvas size
+        _float_pixel_buffer.clear()
+        buffer = np.empty(pixels.shape, dtype=np.float32)
+        _float_pixel_buffer[pixels.shape] = buffer
+    np.divide(pixels[::-1], np.float32(255.0), out=buffer)
+    blender_image.pixels.foreach_set(buffer.ravel())
+
+
+# Names of packed images whose pixels changed without repacking. They are
+# packed from on_save_pre, and from a timer a few seconds after the last
+# reload, because autosave writes the file without running save_pre
+_images_pending_pack = set()
+
+# Seconds after the last deferred update before pending images are packed
+PACK_DELAY = 5.0
 
 
-def pil_image_to_blender(pil_image, name):
+def pil_image_to_blender(pil_image, name, pack=True):
     """
     Convert PIL Image to Blender Image datablock.
     
     Args:
-        pil_image: PIL Image object
+        pil_image: PIL Image object, or numpy uint8 array of shape (height, width, 4)
         name: Name for the Blender image
+        pack: If False and the image is already packed, skip re-encoding it now
+              and leave it to pack_pending_images(), which runs before saving
+              and PACK_DELAY seconds after the last deferred update
     
     Returns:
         bpy.types.Image or None on failure
     """
     try:
-        # Convert to RGBA if needed
-        if pil_image.mode != 'RGBA':
-            pil_image = pil_image.convert('RGBA')
+        if isinstance(pil_image, np.ndarray):
+            pixels = pil_image
+        else:
+            # Convert to RGBA if needed
+            if pil_image.mode != 'RGBA':
+                pil_image = pil_image.convert('RGBA')
+            pixels = np.asarray(pil_image)
         
-        width, height = pil_image.size
+        height, width = pixels.shape[:2]
         
         # Create or get existing Blender image
         blender_image = bpy.data.images.get(name)
@@ -272,23 +483,21 @@ def pil_image_to_blender(pil_image, name):
                 float_buffer=False
             )
         
-        # Convert PIL image to numpy array
         # PSD layers from psd-tools are already in straight/unassociated alpha format
         # (RGB values are NOT premultiplied), so we can use them directly
-        pixels = np.array(pil_image, dtype=np.float32) / 255.0
-        
-        # Flip vertically (Blender images are stored bottom-to-top)
-        pixels = np.flipud(pixels)
-        
-        # Flatten to 1D array
-        pixels = pixels.ravel()
-        
-        # Set pixels
-        blender_image.pixels.foreach_set(pixels)
+        set_image_pixels_rgba8(blender_image, pixels)
         blender_image.update()
         
         # Pack image to prevent issues with missing file paths
-        blender_image.pack()
+        if pack or not blender_image.packed_file:
+            blender_image.pack()
+            _images_pending_pack.discard(blender_image.name)
+        else:
+            _images_pending_pack.add(blender_image.name)
+            # Restart the delay so back-to-back reloads are packed only once
+            if bpy.app.timers.is_registered(pack_pending_images_timer):
+                bpy.app.timers.unregister(pack_pending_images_timer)
+            bpy.app.timers.register(pack_pending_images_timer, first_interval=PACK_DELAY)
         
         return blender_image
         
@@ -297,6 +506,33 @@ def pil_image_to_blender(pil_image, name):
         return None
 
 
+def pack_pending_images():
+    """
+    Repack images whose pixels were updated with pack=False.
+    
+    Returns:
+        int: Number of images repacked
+    """
+    packed_count = 0
+    for name in _images_pending_pack:
+        image = bpy.data.images.get(name)
+        if not image:
+            continue
+        try:
+            image.pack()
+            packed_count += 1
+        except Exception as e:
+            print(f"Failed to pack image '{name}': {e}")
+    _images_pending_pack.clear()
+    return packed_count
+
+
+def pack_pending_images_timer():
+    """Timer callback: pack pending images once the reloads have settled"""
+    pack_pending_images()
+    return None  # Don't repeat
+
+
 def reload_psd_layers(psd_filepath, layer_mapping):
     """
     Reload specific layers from PSD file based on mapping.
@@ -317,6 +553,12 @@ def reload_psd_layers(psd_filepath, layer_mapping):
         print(f"PSD file not found: {psd_filepath}")
         return 0
     
+    try:
+        psd = open_psd(psd_filepath)
+    except Exception as e:
+        print(f"Failed to open PSD file: {e}")
+        return 0
+    
     reloaded_count = 0
     
     for layer_name, blender_image in layer_mapping.items():
@@ -328,7 +570,8 @@ def reload_psd_layers(psd_filepath, layer_mapping):
             pil_image = extract_single_layer(
                 psd_filepath, 
                 layer_name, 
-                as_blender_image=False
+                as_blender_image=False,
+                psd=psd
             )
             
             if not pil_image:
@@ -344,16 +587,8 @@ def reload_psd_layers(psd_filepath, layer_mapping):
             if blender_image.size[0] != width or blender_image.size[1] != height:
                 blender_image.scale(width, height)
             
-            # Convert PIL image to numpy array
             # PSD layers from psd-tools are already in straight/unassociated alpha format
-            pixels = np.array(pil_image, dtype=np.float32) / 255.0
-            
-            # Flip vertically
-            pixels = np.flipud(pixels)
-            
-            # Flatten and set pixels
-            pixels = pixels.ravel()
-            blender_image.pixels.foreach_set(pixels)
+            set_image_pixels_rgba8(blender_image, np.asarray(pil_image))
             blender_image.update()
             
             reloaded_count += 1
@@ -362,6 +597,11 @@ def reload_psd_layers(psd_filepath, layer_mapping):
             print(f"Failed to reload layer '{layer_name}': {e}")
             continue
     
+    # The parsed file and the canvas-sized float buffer can be hundreds of
+    # MB; don't keep them between reloads
+    release_open_psd_files()
+    release_pixel_buffer()
+    
     print(f"Reloaded {reloaded_count}/{len(layer_mapping)} PSD layers")
     return reloaded_count
 
@@ -370,6 +610,8 @@ def get_psd_info(psd_filepath):
     """
     Get basic information about a PSD file.
     
+    Results are cached until the file's modification time or size changes.
+    
     Args:
         psd_filepath: Path to PSD file
     
@@ -387,26 +629,21 @@ def get_psd_info(psd_filepath):
     if not PSD_AVAILABLE:
         return None
     
-    if not os.path.exists(psd_filepath):
+    stamp = get_file_stamp(psd_filepath)
+    if stamp is None:
         return None
     
+    cached = _psd_info_cache.get(psd_filepath)
+    if cached and cached[0] == stamp:
+        return dict(cached[1])
+    
     try:
-        psd = PSDImage.open(psd_filepath)
+        psd = open_psd(psd_filepath)
         
         # Count layers (excluding groups)
-        layer_count = 0
-        def count_layers(layer_list):
-            nonlocal layer_count
-            for layer in layer_list:
-                if hasattr(layer, 'is_group') and layer.is_group():
-                    if hasattr(layer, '__iter__'):
-                        count_layers(layer)
-                else:
-                    layer_count += 1
-        
-        count_layers(psd)
+        layer_count = sum(1 for layer in psd.descendants() if not layer.is_group())
         
-        return {
+        info = {
             'width': psd.width,
             'height': psd.height,
             'channels': psd.channels,
@@ -414,6 +651,8 @@ def get_psd_info(psd_filepath):
             'color_mode': str(psd.color_mode),
             'layer_count': layer_count
         }
+        _psd_info_cache[psd_filepath] = (stamp, info)
+        return dict(info)
         
     except Exception as e:
         print(f"Failed to get PSD info: {e}")
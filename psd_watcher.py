@@ -1,12 +1,15 @@
 """
 PSD File Watcher Module
 
-Uses watchdog library to monitor PSD files for changes.
+Uses watchdog library to monitor PSD files for changes, falling back to
+polling the file from a Blender timer when watchdog is not installed.
 """
 
 import bpy
 import os
+import threading
 import time
+import traceback
 
 try:
     from watchdog.observers import Observer
@@ -14,9 +17,13 @@ try:
     WATCHDOG_AVAILABLE = True
 except ImportError:
     WATCHDOG_AVAILABLE = False
-    print("WARNING: watchdog library not available. Auto-reload will not work.")
+    FileSystemEventHandler = object  # Keep PSDFileHandler importable
+    print("WARNING: watchdog library not available. Auto-reload will poll the PSD file instead.")
     print("Install with: <blender_path>/python/bin/python.exe -m pip install watchdog")
 
+# Seconds between file checks when polling without watchdog
+POLL_INTERVAL = 1.0
+
 
 class PSDFileHandler(FileSystemEventHandler):
     """Handler for PSD file modification events"""
@@ -24,29 +31,67 @@ class PSDFileHandler(FileSystemEventHandler):
     def __init__(self, callback):
         super().__init__()
         self.callback = callback
-        self.last_modified = {}
-        self.debounce_time = 1.0  # Wait 1s before triggering to avoid multiple events (PSD files are larger)
-        
+        self.timers = {}  # filepath -> pending threading.Timer
+        self.lock = threading.Lock()
+        self.debounce_time = 1.0  # Trigger 1s after the last event (PSD files are larger)
+        self.stable_check_time = 0.1  # Size must hold this long before triggering
+    
     def on_modified(self, event):
-        if event.is_directory:
+        if not event.is_directory:
+            self.schedule(event.src_path)
+    
+    def on_created(self, event):
+        if not event.is_directory:
+            self.schedule(event.src_path)
+    
+    def on_moved(self, event):
+        # Saves via a temp file end with a rename onto the PSD
+        if not event.is_directory:
+            self.schedule(event.dest_path)
+    
+    def schedule(self, filepath):
+        """(Re)start the debounce timer for a file; every event pushes it back"""
+        # Check if this is a PSD file
+        ext = os.path.splitext(filepath)[1].lower()
+        if ext not in {'.psd', '.psb'}:
             return
         
-        filepath = event.src_path
-        current_time = time.time()
+        with self.lock:
+            timer = self.timers.get(filepath)
+            if timer:
+                timer.cancel()
+            timer = threading.Timer(self.debounce_time, self.fire, args=(filepath,))
+            timer.daemon = True
+            self.timers[filepath] = timer
+            timer.start()
+    
+    def fire(self, filepath):
+        """Debounce timer expired; trigger once the file has stopped growing"""
+        with self.lock:
+            if self.timers.get(filepath) is not threading.current_thread():
+                return  # Superseded by a newer event
+            del self.timers[filepath]
         
-        # Debounce - ignore if we just processed this file
-        if filepath in self.last_modified:
-            if current_time - self.last_modified[filepath] < self.debounce_time:
+        try:
+            size = os.path.getsize(filepath)
+            time.sleep(self.stable_check_time)
+            if os.path.getsize(filepath) != size:
+                self.schedule(filepath)
                 return
+        except OSError:
+            # File is mid-replace; a following event will reschedule
+            return
         
-        self.last_modified[filepath] = current_time
-        
-        # Check if this is a PSD file
-        ext = os.path.splitext(filepath)[1].lower()
-        if ext in {'.psd', '.psb'}:
-            print(f"PSD file modified: {filepath}")
-            # Call the callback in the main thread
-            self.callback(filepath)
+        print(f"PSD file modified: {filepath}")
+        # Call the callback in the main thread
+        self.callback(filepath)
+    
+    def cancel_all(self):
+        """Cancel all pending debounce timers"""
+        with self.lock:
+            for timer in self.timers.values():
+                timer.cancel()
+            self.timers.clear()
 
 
 class PSDWatcher:
@@ -88,6 +133,8 @@ class PSDWatcher:
     
     def stop_watching(self):
         """Stop watching all files"""
+        if self.handler:
+            self.handler.cancel_all()
         if self.observer:
             self.observer.stop()
             self.observer.join()
@@ -100,18 +147,129 @@ class PSDWatcher:
         return self.observer is not None and self.observer.is_alive()
 
 
+class TimerPoller:
+    """Polls a PSD file's modification time from a Blender timer (no watchdog needed)"""
+    
+    def __init__(self):
+        self.filepath = None
+        self.callback = None
+        self.last_stamp = None
+        self.changed = False
+        # Keep one bound method so the timer can be looked up and removed again
+        self._timer = self._poll
+    
+    @staticmethod
+    def _get_stamp(filepath):
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+    
+    def _poll(self):
+        """Timer callback, runs on the main thread"""
+        stamp = self._get_stamp(self.filepath)
+        if stamp is not None and stamp != self.last_stamp:
+            # Still being written; wait until it is unchanged for a full interval
+            self.last_stamp = stamp
+            self.changed = True
+        elif self.changed and stamp is not None:
+            self.changed = False
+            print(f"PSD file modified: {self.filepath}")
+            self.callback(self.filepath)
+        return POLL_INTERVAL
+    
+    def start_watching(self, filepath, callback):
+        """Start polling a specific PSD file for changes"""
+        abs_path = os.path.abspath(filepath)
+        if not os.path.exists(abs_path):
+            print(f"PSD file does not exist: {abs_path}")
+            return False
+        
+        self.filepath = abs_path
+        self.callback = callback
+        self.last_stamp = self._get_stamp(abs_path)
+        self.changed = False
+        
+        if not bpy.app.timers.is_registered(self._timer):
+            bpy.app.timers.register(self._timer, first_interval=POLL_INTERVAL, persistent=True)
+            print(f"Started polling PSD file: {abs_path}")
+        
+        return True
+    
+    def stop_watching(self):
+        """Stop polling"""
+        if bpy.app.timers.is_registered(self._timer):
+            bpy.app.timers.unregister(self._timer)
+            print("Stopped PSD file polling")
+    
+    def is_watching(self):
+        """Check if currently polling a file"""
+        return bpy.app.timers.is_registered(self._timer)
+
+
 # Global watcher instance
 _watcher = None
 
 
 def get_watcher():
-    """Get or create the global watcher instance"""
+    """Get or create the global watcher instance (watchdog or timer polling)"""
     global _watcher
     if _watcher is None:
-        _watcher = PSDWatcher()
+        _watcher = PSDWatcher() if WATCHDOG_AVAILABLE else TimerPoller()
     return _watcher
 
 
+# PSD files changed since the last reload, drained by reload_pending_psd_files()
+_pending_reloads = set()
+_pending_lock = threading.Lock()
+
+
+def queue_psd_reload(filepath):
+    """
+    Callback when PSD file is modified (may run off the main thread).
+    
+    Changes arriving before the queued reload runs are coalesced into it.
+    """
+    with _pending_lock:
+        first = not _pending_reloads
+        _pending_reloads.add(filepath)
+    
+    # Use timer to run in main thread (wait a bit longer for PSD files to finish saving)
+    if first and not bpy.app.timers.is_registered(reload_pending_psd_files):
+        bpy.app.timers.register(reload_pending_psd_files, first_interval=0.5)
+
+
+def reload_pending_psd_files():
+    """Timer callback: reload the current PSD once if it has pending changes"""
+    with _pending_lock:
+        filepaths = set(_pending_reloads)
+        _pending_reloads.clear()
+    
+    try:
+        # Verify the current PSD file is among the changed ones
+        current_psd_path = bpy.context.scene.cam_proj_paint.projection_psd_file
+        if current_psd_path and os.path.abspath(current_psd_path) in filepaths:
+            print(f"\n{'='*50}")
+            print(f"PSD file changed, auto-reloading layers...")
+            print(f"{'='*50}")
+            
+            # Use the reload operator which extracts and applies all PSD layers
+            bpy.ops.camprojpaint.reload_projection_image()
+        
+    except Exception as e:
+        print(f"Error reloading PSD file: {e}")
+        traceback.print_exc()
+    
+    # Changes queued while this callback ran saw the timer still registered
+    # and did not schedule a new run, so run again for them
+    with _pending_lock:
+        if _pending_reloads:
+            return 0.5
+    
+    return None  # Don't repeat
+
+
 def start_watching_psd_file(scene):
     """Start watching the PSD file for changes"""
     psd_file_path = scene.cam_proj_paint.projection_psd_file
@@ -124,49 +282,23 @@ def start_watching_psd_file(scene):
         print(f"PSD file does not exist: {psd_file_path}")
         return False
     
-    def on_psd_changed(filepath):
-        """Callback when PSD file is modified"""
-        # Schedule reload in main thread
-        def reload_and_apply():
-            try:
-                # Verify this is still the current PSD file
-                current_psd_path = bpy.context.scene.cam_proj_paint.projection_psd_file
-                if not current_psd_path:
-                    return None
-                
-                if os.path.abspath(current_psd_path) != filepath:
-                    return None
-                
-                print(f"\n{'='*50}")
-                print(f"PSD file changed, auto-reloading layers...")
-                print(f"{'='*50}")
-                
-                # Use the reload operator which extracts and applies all PSD layers
-                bpy.ops.camprojpaint.reload_projection_image()
-                
-            except Exception as e:
-                print(f"Error reloading PSD file: {e}")
-                import traceback
-                traceback.print_exc()
-            
-            return None  # Don't repeat
-        
-        # Use timer to run in main thread (wait a bit longer for PSD files to finish saving)
-        bpy.app.timers.register(reload_and_apply, first_interval=0.5)
-    
     watcher = get_watcher()
-    return watcher.start_watching(psd_file_path, on_psd_changed)
+    return watcher.start_watching(psd_file_path, queue_psd_reload)
 
 
 def stop_watching():
     """Stop watching all files"""
     watcher = get_watcher()
     watcher.stop_watching()
+    
+    # Drop reloads queued before watching stopped
+    with _pending_lock:
+        _pending_reloads.clear()
+    if bpy.app.timers.is_registered(reload_pending_psd_files):
+        bpy.app.timers.unregister(reload_pending_psd_files)
 
 
 def is_watching():
     """Check if file watching is active"""
-    if not WATCHDOG_AVAILABLE:
-        return False
     watcher = get_watcher()
     return watcher.is_watching()
@@ -7,16 +7,25 @@ and rendering from an orthographic camera. Much faster than Cycles baking.
 
 import bpy
 import bmesh
+from bpy.app.handlers import persistent
 from mathutils import Vector, Matrix
 from math import radians
 import tempfile
 import os
 import numpy as np
-from scipy import ndimage
+from scipy import ndimage, sparse
+from scipy.sparse import csgraph
 
 # Import common utilities
 from . import common
 
+if common.NUMBA_AVAILABLE:
+    import numba
+
+# Names of images created by render_uv_bake, for the cleanup operator
+_baked_image_names = set()
+
+
 def remove_generate_modifiers(obj):
     """
     Remove modifiers that generate new geometry from the object.
@@ -57,19 +66,20 @@ def duplicate_object_for_baking(obj, collection_name=None):
     if not temp_collection:
         return None
     
-    # Duplicate object and mesh data
-    bpy.ops.object.select_all(action='DESELECT')
-    bpy.context.view_layer.objects.active = obj
-    obj.select_set(True)
-    bpy.ops.object.duplicate()
-    new_obj = bpy.context.view_layer.objects.active
-    new_obj.name = f"{obj.name}_UV_Bake_Temp"
-    
-    
-    bpy.ops.object.convert(target='MESH')
-    new_obj.parent = None
+    # Copy the evaluated mesh (all modifiers applied) into a new object,
+    # without going through the duplicate/convert operators
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    eval_obj = obj.evaluated_get(depsgraph)
+    new_mesh = bpy.data.meshes.new_from_object(eval_obj, preserve_all_data_layers=True, depsgraph=depsgraph)
+    new_obj = bpy.data.objects.new(f"{obj.name}_UV_Bake_Temp", new_mesh)
     new_obj.matrix_world = Matrix.Identity(4)
     
+    # Keep object-linked material slots
+    for slot, new_slot in zip(obj.material_slots, new_obj.material_slots):
+        if slot.link == 'OBJECT':
+            new_slot.link = 'OBJECT'
+            new_slot.material = slot.material
+    
     # Link to temporary collection
     temp_collection.objects.link(new_obj)
     
@@ -102,6 +112,46 @@ def unfold_mesh_to_uv_space(obj, uv_map_name, island_margin=0.002):
         print(f"  Error: UV map '{uv_map_name}' not found in '{obj.name}'")
         return False
     
+    # Find UV seam edges: manifold edges whose two face corners disagree on
+    # the UV at either end
+    n_loops = len(mesh.loops)
+    n_faces = len(mesh.polygons)
+    loop_verts = np.empty(n_loops, dtype=np.int32)
+    mesh.loops.foreach_get('vertex_index', loop_verts)
+    loop_edges = np.empty(n_loops, dtype=np.int32)
+    mesh.loops.foreach_get('edge_index', loop_edges)
+    loop_uvs = np.empty(n_loops * 2, dtype=np.float32)
+    mesh.uv_layers[uv_map_name].data.foreach_get('uv', loop_uvs)
+    loop_uvs = loop_uvs.reshape((n_loops, 2))
+    loop_starts = np.empty(n_faces, dtype=np.int32)
+    mesh.polygons.foreach_get('loop_start', loop_starts)
+    loop_totals = np.empty(n_faces, dtype=np.int32)
+    mesh.polygons.foreach_get('loop_total', loop_totals)
+    
+    # Next corner of each loop within its face (wrapping to the face start)
+    loop_next = np.arange(1, n_loops + 1)
+    loop_next[loop_starts + loop_totals - 1] = loop_starts
+    
+    # The two loops of every edge used by exactly two faces
+    edge_loop_counts = np.bincount(loop_edges, minlength=len(mesh.edges))
+    edge_offsets = np.concatenate(([0], np.cumsum(edge_loop_counts)[:-1]))
+    loops_by_edge = np.argsort(loop_edges, kind='stable')
+    manifold_edges = np.flatnonzero(edge_loop_counts == 2)
+    loop1 = loops_by_edge[edge_offsets[manifold_edges]]
+    loop2 = loops_by_edge[edge_offsets[manifold_edges] + 1]
+    loop1_next = loop_next[loop1]
+    loop2_next = loop_next[loop2]
+    
+    # Match corners on the same vertex (adjacent faces usually wind oppositely)
+    flipped = loop_verts[loop1] != loop_verts[loop2]
+    loop2, loop2_next = np.where(flipped, loop2_next, loop2), np.where(flipped, loop2, loop2_next)
+    
+    uv_gap = np.maximum(
+        np.linalg.norm(loop_uvs[loop1] - loop_uvs[loop2], axis=1),
+        np.linalg.norm(loop_uvs[loop1_next] - loop_uvs[loop2_next], axis=1),
+    )
+    seam_edge_ids = manifold_edges[uv_gap > 0.0001].tolist()
+    
     # Create bmesh from mesh
     bm = bmesh.new()
     bm.from_mesh(mesh)
@@ -116,150 +166,85 @@ def unfold_mesh_to_uv_space(obj, uv_map_name, island_margin=0.002):
         bm.free()
         return False
     
-    # Build mapping of (vertex, face) -> UV coordinate
-    # This is necessary because a vertex can have different UVs on different faces (UV seams)
-    vert_face_uv = {}
-    
-    for face in bm.faces:
-        for loop in face.loops:
-            vert = loop.vert
-            uv = loop[uv_layer].uv
-            key = (vert.index, face.index)
-            vert_face_uv[key] = uv.copy()
-    
-    # Split vertices at UV seams
-    # For each vertex, check if it has multiple different UV coordinates
-    vert_uvs = {}  # vert.index -> list of unique UV coords
-    
-    for (vert_idx, face_idx), uv in vert_face_uv.items():
-        if vert_idx not in vert_uvs:
-            vert_uvs[vert_idx] = []
-        
-        # Check if this UV is unique (not already in list)
-        is_unique = True
-        for existing_uv in vert_uvs[vert_idx]:
-            if (existing_uv - uv).length < 0.0001:  # Small epsilon for floating point comparison
-                is_unique = False
-                break
-        
-        if is_unique:
-            vert_uvs[vert_idx].append(uv)
-    
-    # Split vertices that have multiple UV coordinates
-    verts_to_split = [idx for idx, uvs in vert_uvs.items() if len(uvs) > 1]
-    
-    if verts_to_split:
-        print(f"  Splitting {len(verts_to_split)} vertices at UV seams")
-        
+    if seam_edge_ids:
         # Use bmesh split_edges to separate faces at UV boundaries
         # This is more reliable than manually duplicating vertices
-        edges_to_split = set()
-        
-        for vert_idx in verts_to_split:
-            vert = bm.verts[vert_idx]
-            # Find edges connected to this vertex where adjacent faces have different UVs
-            for edge in vert.link_edges:
-                if len(edge.link_faces) == 2:
-                    face1, face2 = edge.link_faces
-                    
-                    # Get UV coords for this vertex on both faces
-                    uv1 = None
-                    uv2 = None
-                    
-                    for loop in face1.loops:
-                        if loop.vert == vert:
-                            uv1 = loop[uv_layer].uv
-                            break
-                    
-                    for loop in face2.loops:
-                        if loop.vert == vert:
-                            uv2 = loop[uv_layer].uv
-                            break
-                    
-                    # If UVs differ, mark edge for splitting
-                    if uv1 and uv2 and (uv1 - uv2).length > 0.0001:
-                        edges_to_split.add(edge)
-        
-        if edges_to_split:
-            bmesh.ops.split_edges(bm, edges=list(edges_to_split))
-            print(f"  Split {len(edges_to_split)} edges at UV seams")
+        edges_to_split = [bm.edges[i] for i in seam_edge_ids]
+        bmesh.ops.split_edges(bm, edges=edges_to_split)
+        print(f"  Split {len(edges_to_split)} edges at UV seams")
+    
+    # Apply changes back to mesh
+    bm.to_mesh(mesh)
+    bm.free()
     
     # Now set vertex positions to UV coordinates
-    # After splitting, each vertex should have a consistent UV coordinate across its faces
+    # After splitting, each vertex has a consistent UV coordinate across its
+    # faces, so scattering loop UVs onto their vertices is unambiguous
     cam_offset = Vector((.5, .5, 0))
-    for vert in bm.verts:
-        # Get UV coordinate from first face this vertex belongs to
-        # (should be consistent now after splitting)
-        if vert.link_faces:
-            first_face = vert.link_faces[0]
-            for loop in first_face.loops:
-                if loop.vert == vert:
-                    uv = loop[uv_layer].uv
-                    # Set vertex position to (u, v, 0) in world space with offset
-                    vert.co = Vector((uv.x, uv.y, 0)) - cam_offset
-                    break
+    n_verts = len(mesh.vertices)
+    n_loops = len(mesh.loops)
+    
+    loop_verts = np.empty(n_loops, dtype=np.int32)
+    mesh.loops.foreach_get('vertex_index', loop_verts)
+    loop_uvs = np.empty(n_loops * 2, dtype=np.float32)
+    mesh.uv_layers[uv_map_name].data.foreach_get('uv', loop_uvs)
+    
+    # Loose vertices keep their original position
+    coords = np.empty(n_verts * 3, dtype=np.float32)
+    mesh.vertices.foreach_get('co', coords)
+    coords = coords.reshape((n_verts, 3))
+    # Set vertex position to (u, v, 0) in world space with offset
+    coords[loop_verts, :2] = loop_uvs.reshape((n_loops, 2)) - cam_offset.xy
+    coords[loop_verts, 2] = 0.0
     
     # Scale UV islands outward to close seam gaps
     # This helps prevent visible gaps at UV seams after rendering
     if island_margin > 0:
         print(f"  Scaling UV islands by {island_margin*100:.2f}% to close seam gaps...")
         
-        # Find UV islands (connected face groups)
-        # We'll use face connectivity to identify islands
-        face_islands = []
-        unprocessed_faces = set(bm.faces)
+        n_faces = len(mesh.polygons)
+        
+        loop_starts = np.empty(n_faces, dtype=np.int32)
+        mesh.polygons.foreach_get('loop_start', loop_starts)
+        loop_totals = np.empty(n_faces, dtype=np.int32)
+        mesh.polygons.foreach_get('loop_total', loop_totals)
+        
+        # Face owning each loop
+        loop_faces = np.empty(n_loops, dtype=np.int64)
+        face_offsets = np.zeros(n_faces, dtype=np.int64)
+        np.cumsum(loop_totals[:-1], out=face_offsets[1:])
+        face_loops = np.arange(loop_totals.sum()) + np.repeat(loop_starts - face_offsets, loop_totals)
+        loop_faces[face_loops] = np.repeat(np.arange(n_faces), loop_totals)
+        
+        # Find UV islands (connected face groups): faces sharing a vertex are
+        # connected, so label the face-vertex incidence graph
+        incidence = sparse.coo_matrix(
+            (np.ones(n_loops, dtype=np.int8), (loop_faces, n_faces + loop_verts)),
+            shape=(n_faces + n_verts, n_faces + n_verts)
+        )
+        _, labels = csgraph.connected_components(incidence, directed=False)
+        island_ids, face_islands = np.unique(labels[:n_faces], return_inverse=True)
         
-        while unprocessed_faces:
-            # Start a new island
-            island = set()
-            to_process = {unprocessed_faces.pop()}
-            
-            while to_process:
-                face = to_process.pop()
-                if face in island:
-                    continue
-                
-                island.add(face)
-                
-                # Add connected faces (faces sharing vertices)
-                for vert in face.verts:
-                    for linked_face in vert.link_faces:
-                        if linked_face in unprocessed_faces:
-                            to_process.add(linked_face)
-                            unprocessed_faces.discard(linked_face)
-            
-            face_islands.append(island)
+        print(f"  Found {len(island_ids)} UV island(s)")
         
-        print(f"  Found {len(face_islands)} UV island(s)")
+        # Island of each vertex (-1 for loose vertices)
+        vert_islands = np.full(n_verts, -1, dtype=np.int64)
+        vert_islands[loop_verts] = face_islands[loop_faces]
+        
+        # Calculate island centers (average of all vertex positions)
+        island_verts = vert_islands >= 0
+        vert_islands = vert_islands[island_verts]
+        n_islands = len(island_ids)
+        centers = np.empty((n_islands, 3))
+        for axis in range(3):
+            centers[:, axis] = np.bincount(vert_islands, weights=coords[island_verts, axis], minlength=n_islands)
+        centers /= np.bincount(vert_islands, minlength=n_islands)[:, np.newaxis]
         
         # Scale each island from its center
-        for island in face_islands:
-            if not island:
-                continue
-            
-            # Calculate island center (average of all vertex positions)
-            island_verts = set()
-            for face in island:
-                island_verts.update(face.verts)
-            
-            if not island_verts:
-                continue
-            
-            center = Vector((0, 0, 0))
-            for vert in island_verts:
-                center += vert.co
-            center /= len(island_verts)
-            
-            # Scale vertices away from center
-            scale_factor = 1.0 + island_margin
-            for vert in island_verts:
-                # Move vertex away from island center
-                direction = vert.co - center
-                vert.co = center + direction * scale_factor
+        vert_centers = centers[vert_islands]
+        coords[island_verts] = vert_centers + (coords[island_verts] - vert_centers) * (1.0 + island_margin)
     
-    # Apply changes back to mesh
-    bm.to_mesh(mesh)
-    bm.free()
+    mesh.vertices.foreach_set('co', coords.ravel())
     
     # Clear parent and reset transform
     # This ensures the object is positioned exactly at its vertex coordinates
@@ -427,6 +412,59 @@ def setup_uv_bake_camera(obj, resolution_x=2048, resolution_y=2048):
 # Phase 3: EEVEE Rendering
 # ============================================================================
 
+if common.NUMBA_AVAILABLE:
+    @numba.njit(cache=True)
+    def dilate_rgb_jit(rgb, mask, iterations):
+        """
+        Fused version of the dilate_image_margins loop (compiled with Numba).
+        
+        Args:
+            rgb: Numpy float32 array of shape (height + 2, width + 2, 3), zero-padded
+                 by one pixel, modified in place
+            mask: Numpy bool array of shape (height, width), modified in place
+            iterations: Number of dilation passes
+        """
+        height, width = mask.shape
+        new_pixels = np.zeros((height, width), dtype=np.bool_)
+        
+        for _ in range(iterations):
+            # Newly exposed pixels: outside the mask with a 4-connected neighbor inside
+            count = 0
+            for y in range(height):
+                for x in range(width):
+                    if not mask[y, x] and (
+                            (y > 0 and mask[y - 1, x]) or (y < height - 1 and mask[y + 1, x]) or
+                            (x > 0 and mask[y, x - 1]) or (x < width - 1 and mask[y, x + 1])):
+                        new_pixels[y, x] = True
+                        count += 1
+            
+            if count == 0:
+                break
+            
+            # Average the 3x3 neighborhood of every new pixel before writing any
+            averaged = np.empty((count, 3), dtype=np.float32)
+            k = 0
+            for y in range(height):
+                for x in range(width):
+                    if new_pixels[y, x]:
+                        for c in range(3):
+                            total = np.float32(0.0)
+                            for dy in range(3):
+                                for dx in range(3):
+                                    total += rgb[y + dy, x + dx, c]
+                            averaged[k, c] = total * np.float32(1.0 / 9.0)
+                        k += 1
+            
+            k = 0
+            for y in range(height):
+                for x in range(width):
+                    if new_pixels[y, x]:
+                        rgb[y + 1, x + 1, :] = averaged[k]
+                        mask[y, x] = True
+                        new_pixels[y, x] = False
+                        k += 1
+
+
 def dilate_image_margins(image, iterations=8):
     """
     Dilate non-transparent pixels outward to fill margin gaps and prevent seams.
@@ -449,14 +487,21 @@ def dilate_image_margins(image, iterations=8):
     height = image.size[1]
     
     # Get pixel data as numpy array (RGBA, flattened)
-    pixels = np.array(image.pixels[:]).reshape((height, width, 4))
+    pixels = np.empty(width * height * 4, dtype=np.float32)
+    image.pixels.foreach_get(pixels)
+    pixels = pixels.reshape((height, width, 4))
     
     # Create alpha mask (where we have content)
     alpha_mask = pixels[:, :, 3] > 0.01
     
-    # For each RGB channel, dilate using the alpha mask
-    for channel in range(3):
-        channel_data = pixels[:, :, channel].copy()
+    # Dilate all RGB channels together using the alpha mask. The RGB data is
+    # zero-padded by one pixel so 3x3 neighborhoods never leave the array
+    rgb = np.zeros((height + 2, width + 2, 3), dtype=np.float32)
+    rgb[1:-1, 1:-1] = pixels[:, :, :3]
+    
+    if common.NUMBA_AVAILABLE:
+        dilate_rgb_jit(rgb, alpha_mask, iterations)
+    else:
         current_mask = alpha_mask.copy()
         
         # Iteratively dilate
@@ -472,23 +517,29 @@ def dilate_image_margins(image, iterations=8):
                 break
             
             # Fill new pixels with average of neighboring filled pixels
-            # Use a simple averaging filter on the current channel data
-            averaged = ndimage.uniform_filter(channel_data, size=3, mode='constant', cval=0.0)
+            # Use a simple 3x3 averaging filter, evaluated only at the new pixels
+            # (positions shifted by the padding)
+            ys, xs = np.nonzero(new_pixels)
+            averaged = np.zeros((len(ys), 3), dtype=np.float32)
+            for dy in range(3):
+                for dx in range(3):
+                    averaged += rgb[ys + dy, xs + dx]
+            averaged *= 1.0 / 9.0
             
             # Only update the newly dilated pixels
-            channel_data[new_pixels] = averaged[new_pixels]
+            rgb[ys + 1, xs + 1] = averaged
             
             # Update mask for next iteration
             current_mask = dilated_mask
-        
-        # Write dilated channel back
-        pixels[:, :, channel] = channel_data
+            
+    # Write dilated channels back
+    pixels[:, :, :3] = rgb[1:-1, 1:-1]
     
     # Set alpha to 1.0 where we dilated (optional - keeps transparent areas transparent)
     # pixels[:, :, 3] = np.where(current_mask, 1.0, pixels[:, :, 3])
     
     # Write back to image
-    image.pixels[:] = pixels.flatten()
+    image.pixels.foreach_set(pixels.ravel())
     image.update()
     
     return True
@@ -534,6 +585,17 @@ def configure_render_settings(scene, resolution_x, resolution_y, use_transparent
     scene.eevee.taa_render_samples = 1
     print(f"  EEVEE Samples: 1")
     
+    # Output format for the temp render read back by render_to_image:
+    # RGBA PNG without zlib compression (save/load is I/O only). Scenes set up
+    # for more than 8 bits (16-bit or float formats) keep that with 16-bit PNG
+    color_depth = '16' if original_settings.color_depth in {'16', '32'} else '8'
+    image_settings = scene.render.image_settings
+    image_settings.file_format = 'PNG'
+    image_settings.color_mode = 'RGBA'
+    image_settings.color_depth = color_depth
+    image_settings.compression = 0
+    print(f"  Temp render format: PNG RGBA {color_depth}-bit, uncompressed")
+    
     return original_settings
 
 
@@ -543,7 +605,7 @@ def separate_object_by_materials(obj, collection_name=None):
     
     if obj.type == 'MESH':
         # Separate by material
-        bpy.ops.object.select_all(action='DESELECT')
+        common.deselect_all_objects()
         bpy.context.view_layer.objects.active = obj
         obj.select_set(True)
         bpy.ops.object.mode_set(mode='EDIT')
@@ -572,7 +634,7 @@ def separate_object_by_materials(obj, collection_name=None):
         print(f"Object '{obj.name}' is not a mesh.")
         return []
 
-def render_to_image(scene, camera, target_image, render_object=None, margin_pixels=8):
+def render_to_image(scene, camera, target_image, render_object=None, margin_pixels=8, scratch_image=None):
     """
     Step 3B & 3C: Render scene and copy result to target image.
     
@@ -583,6 +645,8 @@ def render_to_image(scene, camera, target_image, render_object=None, margin_pixe
         render_object: Optional - the specific object to render. If provided, all other
                       renderable objects will be temporarily hidden
         margin_pixels: Number of pixels to dilate for UV margins (prevents seams)
+        scratch_image: Optional - image reused to read back the saved render. If not
+                      provided, a temporary image is loaded and removed per call
         
     Returns:
         True if successful, False otherwise
@@ -595,10 +659,8 @@ def render_to_image(scene, camera, target_image, render_object=None, margin_pixe
     
     if render_object:
         # Hide all other renderable objects (meshes, curves, etc.)
-        renderable_types = {'MESH', 'CURVE', 'SURFACE', 'META', 'FONT', 'CURVES', 'POINTCLOUD', 'VOLUME'}
-        
         for obj in scene.objects:
-            if obj.type in renderable_types and obj != render_object:
+            if obj.type in common.RENDERABLE_OBJECT_TYPES and obj != render_object:
                 original_hide_states[obj] = obj.hide_render
                 obj.hide_render = True
     
@@ -620,13 +682,20 @@ def render_to_image(scene, camera, target_image, render_object=None, margin_pixe
         print(f"  Saving render to temp file...")
         render_result.save_render(filepath=temp_filepath)
         
-        # Load the saved render
-        temp_loaded = bpy.data.images.load(temp_filepath)
+        # Load the saved render, reusing the scratch datablock when given
+        if scratch_image:
+            scratch_image.filepath_raw = temp_filepath
+            scratch_image.source = 'FILE'
+            scratch_image.reload()
+            temp_loaded = scratch_image
+        else:
+            temp_loaded = bpy.data.images.load(temp_filepath)
         
         # Ensure target image has correct size and copy pixels
         if not common.copy_image_pixels(temp_loaded, target_image, resize_if_needed=True):
             print(f"  Error: Failed to copy pixels to target image")
-            common.remove_image(temp_loaded)
+            if temp_loaded is not scratch_image:
+                common.remove_image(temp_loaded)
             return False
         
         # Dilate margins to prevent seams at UV boundaries
@@ -638,7 +707,8 @@ def render_to_image(scene, camera, target_image, render_object=None, margin_pixe
                 print(f"  ⚠ Warning: Margin dilation failed")
         
         # Cleanup temporary files
-        common.remove_image(temp_loaded)
+        if temp_loaded is not scratch_image:
+            common.remove_image(temp_loaded)
         try:
             os.remove(temp_filepath)
         except:
@@ -654,23 +724,25 @@ def render_to_image(scene, camera, target_image, render_object=None, margin_pixe
             obj.hide_render = hide_state
 
 
-def render_uv_bake(obj, camera, resolution_x=2048, resolution_y=2048, use_transparent=True, margin_pixels=8):
+def iter_render_uv_bake(obj, camera, rendered_images, resolution_x=2048, resolution_y=2048,
+                        use_transparent=True, margin_pixels=8):
     """
-    Complete Phase 3: Render UV-baked textures for each material.
+    Phase 3 as a generator that renders one material per step.
     
-    This function separates the object by materials and renders each material separately.
-    This ensures clean renders without bleed-through between materials.
+    Yields before each material render, so callers can spread the bake over
+    several UI updates. Closing the generator early still restores the scene.
     
     Args:
         obj: The UV-unfolded object to render
         camera: The UV bake camera
+        rendered_images: Dictionary filled with {material_index: rendered_image}
         resolution_x: Target texture width
         resolution_y: Target texture height
         use_transparent: Enable transparent background
         margin_pixels: Number of pixels to dilate for UV margins (prevents seams)
         
-    Returns:
-        Dictionary of {material_index: rendered_image}
+    Yields:
+        Tuple of (materials_done, material_count)
     """
     scene = bpy.context.scene
     
@@ -684,8 +756,9 @@ def render_uv_bake(obj, camera, resolution_x=2048, resolution_y=2048, use_transp
     # Set the active camera
     scene.camera = camera
     
-    rendered_images = {}
     separated_objects = []
+    scratch_image = None
+    original_hide_states = {}
     
     try:
         # Step 3B: Separate object by materials
@@ -695,7 +768,22 @@ def render_uv_bake(obj, camera, resolution_x=2048, resolution_y=2048, use_transp
         separated_objects = separate_object_by_materials(obj)
         if not separated_objects:
             print("  No separated objects created - object may have no materials")
-            return {}
+            return
+        
+        # Hide every renderable object once; each material's object is then
+        # shown only for its own render instead of re-hiding the whole scene
+        for scene_obj in scene.objects:
+            if scene_obj.type in common.RENDERABLE_OBJECT_TYPES:
+                original_hide_states[scene_obj] = scene_obj.hide_render
+                scene_obj.hide_render = True
+        
+        # One scratch image receives every material's saved render
+        scratch_image = common.create_image(
+            name=common.UV_BAKE_SCRATCH_IMAGE_NAME,
+            width=resolution_x,
+            height=resolution_y,
+            alpha=True
+        )
         
         print(f"\nRendering {len(separated_objects)} separated object(s):")
         # print names of separated objects and the materials they correspond to
@@ -704,7 +792,9 @@ def render_uv_bake(obj, camera, resolution_x=2048, resolution_y=2048, use_transp
             mat_name = sep_obj.data.materials[mat_index].name if mat_index != -1 else "None"
             print(f"  - '{sep_obj.name}': Material Index {mat_index}, Material Name '{mat_name}'")
         # Step 3C: Render each separated object
-        for separated_obj in separated_objects:
+        for index, separated_obj in enumerate(separated_objects):
+            yield index, len(separated_objects)
+            
             material = separated_obj.data.materials[0] if separated_obj.data.materials else None
             if not material:
                 print(f"  Object '{separated_obj.name}': No material - skipping")
@@ -730,8 +820,16 @@ def render_uv_bake(obj, camera, resolution_x=2048, resolution_y=2048, use_transp
                 continue
             
             # Render and copy to image (with margin dilation)
-            if render_to_image(scene, camera, temp_image, render_object=separated_obj, margin_pixels=margin_pixels):
+            separated_obj.hide_render = False
+            try:
+                rendered = render_to_image(scene, camera, temp_image, margin_pixels=margin_pixels,
+                                           scratch_image=scratch_image)
+            finally:
+                separated_obj.hide_render = True
+            
+            if rendered:
                 rendered_images[mat_index] = temp_image
+                _baked_image_names.add(temp_image.name)
                 print(f"  ✓ Material {mat_index} rendered successfully")
             else:
                 print(f"  ✗ Material {mat_index} render failed")
@@ -744,11 +842,53 @@ def render_uv_bake(obj, camera, resolution_x=2048, resolution_y=2048, use_transp
         # Always restore original settings
         original_settings.restore(scene)
         
+        # Restore original hide_render states
+        for scene_obj, hide_state in original_hide_states.items():
+            scene_obj.hide_render = hide_state
+        
+        common.remove_image(scratch_image)
+        # Free the copy scratch buffer used by render_to_image
+        common.release_pixel_buffers()
+        
         # # Cleanup separated objects
         print("Cleaning up separated objects...")
         for separated_obj in separated_objects:
             common.remove_object(separated_obj)
 
+
+def render_uv_bake(obj, camera, resolution_x=2048, resolution_y=2048, use_transparent=True, margin_pixels=8,
+                   progress_cb=None, cancel_cb=None):
+    """
+    Complete Phase 3: Render UV-baked textures for each material.
+    
+    This function separates the object by materials and renders each material separately.
+    This ensures clean renders without bleed-through between materials.
+    
+    Args:
+        obj: The UV-unfolded object to render
+        camera: The UV bake camera
+        resolution_x: Target texture width
+        resolution_y: Target texture height
+        use_transparent: Enable transparent background
+        margin_pixels: Number of pixels to dilate for UV margins (prevents seams)
+        progress_cb: Optional - called as progress_cb(materials_done, material_count)
+                     before each material render
+        cancel_cb: Optional - checked before each material render; returning True
+                   stops the bake and keeps the materials rendered so far
+        
+    Returns:
+        Dictionary of {material_index: rendered_image}
+    """
+    rendered_images = {}
+    bake = iter_render_uv_bake(obj, camera, rendered_images, resolution_x, resolution_y,
+                               use_transparent, margin_pixels)
+    for done, total in bake:
+        if progress_cb:
+            progress_cb(done, total)
+        if cancel_cb and cancel_cb():
+            print(f"  Bake cancelled after {done}/{total} materials")
+            bake.close()
+            break
     return rendered_images
 
 
@@ -767,27 +907,30 @@ class UVBAKE_PT_test_panel(bpy.types.Panel):
     @classmethod
     def poll(cls, context):
         # Only show panel if enabled in addon preferences
-        preferences = context.preferences.addons.get(__package__)
-        if preferences and hasattr(preferences.preferences, 'show_test_ui'):
-            return preferences.preferences.show_test_ui
-        return False
+        addon = context.preferences.addons.get(__package__)
+        return bool(addon and getattr(addon.preferences, 'show_test_ui', False))
     
     def draw(self, context):
         layout = self.layout
-        scene = context.scene
+        settings = context.scene.uv_bake
+        
+        # Active object state shared by the info labels and button rows
+        obj = context.active_object
+        is_mesh = obj is not None and obj.type == 'MESH'
+        uv_layers = obj.data.uv_layers if is_mesh else None
+        has_uv = bool(uv_layers)
         
         # Phase 1 box
         box = layout.box()
         box.label(text="Phase 1: UV Unfolding", icon='UV')
         
         # Active object info
-        obj = context.active_object
-        if obj and obj.type == 'MESH':
+        if is_mesh:
             box.label(text=f"Active: {obj.name}", icon='OBJECT_DATA')
             
             # UV map info
-            if obj.data.uv_layers:
-                uv_map = obj.data.uv_layers.active
+            if has_uv:
+                uv_map = uv_layers.active
                 if uv_map:
                     box.label(text=f"UV Map: {uv_map.name}", icon='UV_DATA')
             else:
@@ -797,7 +940,7 @@ class UVBAKE_PT_test_panel(bpy.types.Panel):
         
         # Island margin option
         row = box.row()
-        row.prop(scene, "uv_bake_island_margin", text="Island Margin", slider=True)
+        row.prop(settings, "island_margin", text="Island Margin", slider=True)
         
         box.separator()
         
@@ -805,8 +948,7 @@ class UVBAKE_PT_test_panel(bpy.types.Panel):
         row = box.row()
         row.scale_y = 2.0
         op = row.operator("uvbake.prepare_object", icon='MOD_UVPROJECT', text="Step 1: Prepare for Bake")
-        # Ensure a strict boolean is assigned (avoid None from short-circuiting)
-        row.enabled = (obj is not None and obj.type == 'MESH' and len(obj.data.uv_layers) > 0)
+        row.enabled = has_uv
 
         box.separator()
         box.label(text="Creates UV-unfolded duplicate", icon='INFO')
@@ -820,8 +962,8 @@ class UVBAKE_PT_test_panel(bpy.types.Panel):
         # Resolution settings
         row = box.row(align=True)
         row.label(text="Resolution:")
-        row.prop(scene, "uv_bake_res_x", text="X")
-        row.prop(scene, "uv_bake_res_y", text="Y")
+        row.prop(settings, "res_x", text="X")
+        row.prop(settings, "res_y", text="Y")
         
         box.separator()
         
@@ -829,8 +971,7 @@ class UVBAKE_PT_test_panel(bpy.types.Panel):
         row = box.row()
         row.scale_y = 2.0
         row.operator("uvbake.setup_camera", icon='CAMERA_DATA', text="Step 2: Setup Camera")
-        # Make sure row.enabled is a boolean (obj could be None)
-        row.enabled = (obj is not None and obj.type == 'MESH')
+        row.enabled = is_mesh
 
         box.separator()
         box.label(text="Creates ortho camera + scales object", icon='INFO')
@@ -843,11 +984,11 @@ class UVBAKE_PT_test_panel(bpy.types.Panel):
         
         # Transparent background option
         row = box.row()
-        row.prop(scene, "uv_bake_transparent", text="Transparent Background")
+        row.prop(settings, "transparent", text="Transparent Background")
         
         # Margin pixels option
         row = box.row()
-        row.prop(scene, "uv_bake_margin", text="Margin (pixels)")
+        row.prop(settings, "margin", text="Margin (pixels)")
         
         box.separator()
         
@@ -855,8 +996,7 @@ class UVBAKE_PT_test_panel(bpy.types.Panel):
         row = box.row()
         row.scale_y = 2.0
         row.operator("uvbake.render", icon='RENDER_STILL', text="Step 3: Render Bake")
-        # Ensure boolean value for enabled
-        row.enabled = (obj is not None and obj.type == 'MESH')
+        row.enabled = is_mesh
 
         box.separator()
         box.label(text="Renders each material to image", icon='INFO')
@@ -899,33 +1039,37 @@ class UVBAKE_OT_prepare_object(bpy.types.Operator):
         
         uv_map_name = obj.data.uv_layers.active.name
         scene = context.scene
-        island_margin = scene.uv_bake_island_margin
-        
-        print("\n" + "="*60)
-        print("EEVEE UV BAKE - PHASE 1: PREPARE OBJECT")
-        print("="*60)
+        island_margin = scene.uv_bake.island_margin
         
-        # Execute Phase 1: Steps 1A, 1B, 1C
-        duplicate = prepare_object_for_uv_bake(obj, uv_map_name, island_margin=island_margin)
+        # Helpers print their steps directly; the banner and result are
+        # written as one block once the operator finishes
+        log = common.ConsoleLog()
+        log("\n" + "="*60)
+        log("EEVEE UV BAKE - PHASE 1: PREPARE OBJECT")
+        log("="*60)
         
-        if duplicate:
-            print("="*60)
-            print(f"✓ SUCCESS: Created '{duplicate.name}'")
-            print("="*60 + "\n")
-            
-            # Select the duplicate to show result
-            bpy.ops.object.select_all(action='DESELECT')
-            duplicate.select_set(True)
-            context.view_layer.objects.active = duplicate
-            
-            self.report({'INFO'}, f"Created UV-unfolded duplicate: {duplicate.name}")
-        else:
-            print("="*60)
-            print("✗ FAILED: Could not prepare object")
-            print("="*60 + "\n")
+        try:
+            # Execute Phase 1: Steps 1A, 1B, 1C
+            duplicate = prepare_object_for_uv_bake(obj, uv_map_name, island_margin=island_margin)
             
-            self.report({'ERROR'}, "Failed to prepare object for UV baking")
-            return {'CANCELLED'}
+            if duplicate:
+                log(f"✓ SUCCESS: Created '{duplicate.name}'")
+                log("="*60 + "\n")
+                
+                # Select the duplicate to show result
+                common.deselect_all_objects(context)
+                duplicate.select_set(True)
+                context.view_layer.objects.active = duplicate
+                
+                self.report({'INFO'}, f"Created UV-unfolded duplicate: {duplicate.name}")
+            else:
+                log("✗ FAILED: Could not prepare object")
+                log("="*60 + "\n")
+                
+                self.report({'ERROR'}, "Failed to prepare object for UV baking")
+                return {'CANCELLED'}
+        finally:
+            log.flush()
         
         return {'FINISHED'}
 
@@ -945,32 +1089,34 @@ class UVBAKE_OT_setup_camera(bpy.types.Operator):
             return {'CANCELLED'}
         
         scene = context.scene
-        resolution_x = scene.uv_bake_res_x
-        resolution_y = scene.uv_bake_res_y
-        
-        print("\n" + "="*60)
-        print("EEVEE UV BAKE - PHASE 2: SETUP CAMERA")
-        print("="*60)
+        resolution_x = scene.uv_bake.res_x
+        resolution_y = scene.uv_bake.res_y
         
-        # Execute Phase 2: Steps 2A, 2B
-        camera = setup_uv_bake_camera(obj, resolution_x, resolution_y)
+        log = common.ConsoleLog()
+        log("\n" + "="*60)
+        log("EEVEE UV BAKE - PHASE 2: SETUP CAMERA")
+        log("="*60)
         
-        if camera:
-            print("="*60)
-            print(f"✓ SUCCESS: Camera ready, object scaled")
-            print("="*60 + "\n")
-            
-            # Set as active camera for preview
-            context.scene.camera = camera
-            
-            self.report({'INFO'}, f"Created UV bake camera ({resolution_x}x{resolution_y})")
-        else:
-            print("="*60)
-            print("✗ FAILED: Could not setup camera")
-            print("="*60 + "\n")
+        try:
+            # Execute Phase 2: Steps 2A, 2B
+            camera = setup_uv_bake_camera(obj, resolution_x, resolution_y)
             
-            self.report({'ERROR'}, "Failed to setup UV bake camera")
-            return {'CANCELLED'}
+            if camera:
+                log(f"✓ SUCCESS: Camera ready, object scaled")
+                log("="*60 + "\n")
+                
+                # Set as active camera for preview
+                context.scene.camera = camera
+                
+                self.report({'INFO'}, f"Created UV bake camera ({resolution_x}x{resolution_y})")
+            else:
+                log("✗ FAILED: Could not setup camera")
+                log("="*60 + "\n")
+                
+                self.report({'ERROR'}, "Failed to setup UV bake camera")
+                return {'CANCELLED'}
+        finally:
+            log.flush()
         
         return {'FINISHED'}
 
@@ -982,51 +1128,119 @@ class UVBAKE_OT_render(bpy.types.Operator):
     bl_description = "Render each material separately using EEVEE"
     bl_options = {'REGISTER', 'UNDO'}
     
-    def execute(self, context):
+    _timer = None
+    _bake = None
+    _rendered_images = None
+    
+    def get_bake_inputs(self, context):
+        """
+        Validate the selection and gather the Phase 3 arguments.
+        
+        Returns:
+            Tuple of (obj, camera, settings), or None if invalid (already reported)
+        """
         obj = context.active_object
         
         if not obj or obj.type != 'MESH':
             self.report({'ERROR'}, "Select a mesh object")
-            return {'CANCELLED'}
+            return None
         
         # Check if UV_Bake_Camera exists
         camera = bpy.data.objects.get(common.UV_BAKE_CAMERA_NAME)
         if not camera:
             self.report({'ERROR'}, f"{common.UV_BAKE_CAMERA_NAME} not found. Run Step 2 first")
-            return {'CANCELLED'}
+            return None
         
-        scene = context.scene
-        resolution_x = scene.uv_bake_res_x
-        resolution_y = scene.uv_bake_res_y
-        use_transparent = scene.uv_bake_transparent
-        margin_pixels = scene.uv_bake_margin
+        return obj, camera, context.scene.uv_bake
+    
+    def finish(self, context, rendered_images):
+        """Show the first rendered image and report the result"""
+        if rendered_images:
+            # Show first rendered image in UV editor for preview
+            first_image = next(iter(rendered_images.values()))
+            # Try to show in image editor
+            for area in context.screen.areas:
+                if area.type == 'IMAGE_EDITOR':
+                    area.spaces.active.image = first_image
+                    break
+            
+            self.report({'INFO'}, f"Rendered {len(rendered_images)} material(s)")
+            return {'FINISHED'}
+        
+        self.report({'WARNING'}, "No materials were rendered")
+        return {'CANCELLED'}
+    
+    def execute(self, context):
+        inputs = self.get_bake_inputs(context)
+        if not inputs:
+            return {'CANCELLED'}
+        obj, camera, settings = inputs
         
         # Execute Phase 3
         rendered_images = render_uv_bake(
             obj, 
             camera, 
-            resolution_x, 
-            resolution_y, 
-            use_transparent,
-            margin_pixels
+            settings.res_x, 
+            settings.res_y, 
+            settings.transparent,
+            settings.margin
         )
         
-        if rendered_images:
-            # Show first rendered image in UV editor for preview
-            if len(rendered_images) > 0:
-                first_image = list(rendered_images.values())[0]
-                # Try to show in image editor
-                for area in context.screen.areas:
-                    if area.type == 'IMAGE_EDITOR':
-                        area.spaces.active.image = first_image
-                        break
-            
-            self.report({'INFO'}, f"Rendered {len(rendered_images)} material(s)")
-        else:
-            self.report({'WARNING'}, "No materials were rendered")
+        return self.finish(context, rendered_images)
+    
+    def invoke(self, context, event):
+        inputs = self.get_bake_inputs(context)
+        if not inputs:
             return {'CANCELLED'}
+        obj, camera, settings = inputs
+        
+        # Render one material per timer tick so the UI keeps redrawing
+        self._rendered_images = {}
+        self._bake = iter_render_uv_bake(
+            obj,
+            camera,
+            self._rendered_images,
+            settings.res_x,
+            settings.res_y,
+            settings.transparent,
+            settings.margin
+        )
         
-        return {'FINISHED'}
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(0.05, window=context.window)
+        wm.modal_handler_add(self)
+        wm.progress_begin(0, 100)
+        return {'RUNNING_MODAL'}
+    
+    def modal(self, context, event):
+        if event.type == 'ESC':
+            # Closing the generator restores the scene; keep finished materials
+            self.stop(context)
+            self.report({'WARNING'}, f"UV bake cancelled after {len(self._rendered_images)} material(s)")
+            return {'CANCELLED'}
+        
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+        
+        try:
+            done, total = next(self._bake)
+        except StopIteration:
+            self.stop(context)
+            return self.finish(context, self._rendered_images)
+        except Exception as e:
+            self.stop(context)
+            self.report({'ERROR'}, f"UV bake failed: {e}")
+            return {'CANCELLED'}
+        
+        context.window_manager.progress_update(100 * done / total)
+        return {'RUNNING_MODAL'}
+    
+    def stop(self, context):
+        """Remove the timer and close the bake generator"""
+        wm = context.window_manager
+        wm.event_timer_remove(self._timer)
+        wm.progress_end()
+        self._bake.close()
 
 
 class UVBAKE_OT_cleanup_temp(bpy.types.Operator):
@@ -1038,24 +1252,25 @@ class UVBAKE_OT_cleanup_temp(bpy.types.Operator):
     
     def execute(self, context):
         removed_objects = 0
-        removed_images = 0
         
         # Find and remove temporary collection
         temp_collection = bpy.data.collections.get(common.UV_BAKE_TEMP_COLLECTION)
         if temp_collection:
-            # Remove all objects in the collection
-            for obj in list(temp_collection.objects):
-                common.remove_object(obj)
-                removed_objects += 1
+            # Remove all objects in the collection in one batch
+            removed_objects = common.remove_ids(temp_collection.objects, common.remove_object)
             
             # Remove the collection itself
             common.remove_collection(temp_collection)
         
-        # Remove rendered images
-        for img in list(bpy.data.images):
-            if img.name.startswith("UV_Bake_Render_"):
-                common.remove_image(img)
-                removed_images += 1
+        # Remove rendered images tracked this session; fall back to a name
+        # scan when nothing is tracked (e.g. after reloading the file)
+        if _baked_image_names:
+            images = [bpy.data.images.get(name) for name in _baked_image_names]
+        else:
+            images = [img for img in bpy.data.images if img.name.startswith(common.TEMP_BAKE_IMAGE_PREFIX)]
+        _baked_image_names.clear()
+        
+        removed_images = common.remove_ids(images, common.remove_image)
         
         if removed_objects > 0 or removed_images > 0:
             print(f"\nCleaned up {removed_objects} objects and {removed_images} images")
@@ -1113,20 +1328,37 @@ class UVBAKE_AddonPreferences(bpy.types.AddonPreferences):
         default=False
     )
     
+    verbose_logging: bpy.props.BoolProperty(
+        name="Verbose Console Output",
+        description="Print detailed per-object progress to the system console",
+        default=False
+    )
+    
+    prewarm_shaders: bpy.props.BoolProperty(
+        name="Prewarm EEVEE Shaders",
+        description="Render a tiny throwaway scene shortly after startup so EEVEE's "
+                    "shaders are already compiled for the first bake. This is a real "
+                    "render: it runs render handlers from other add-ons, replaces the "
+                    "Render Result image and blocks the UI while shaders compile",
+        default=False
+    )
+    
     def draw(self, context):
         layout = self.layout
         box = layout.box()
         box.label(text="UV Bake Settings:", icon='UV')
         box.prop(self, "show_test_ui")
+        box.prop(self, "verbose_logging")
+        box.prop(self, "prewarm_shaders")
 
 
 # ============================================================================
 # Scene Properties
 # ============================================================================
 
-def register_properties():
-    """Register scene properties for UV baking settings"""
-    bpy.types.Scene.uv_bake_res_x = bpy.props.IntProperty(
+class UVBAKE_SceneSettings(bpy.types.PropertyGroup):
+    """Scene-level settings for UV baking"""
+    res_x: bpy.props.IntProperty(
         name="Resolution X",
         description="Bake texture width",
         default=2048,
@@ -1134,7 +1366,7 @@ def register_properties():
         max=8192
     )
     
-    bpy.types.Scene.uv_bake_res_y = bpy.props.IntProperty(
+    res_y: bpy.props.IntProperty(
         name="Resolution Y",
         description="Bake texture height",
         default=2048,
@@ -1142,13 +1374,13 @@ def register_properties():
         max=8192
     )
     
-    bpy.types.Scene.uv_bake_transparent = bpy.props.BoolProperty(
+    transparent: bpy.props.BoolProperty(
         name="Transparent Background",
         description="Use transparent film background for rendering",
         default=True
     )
     
-    bpy.types.Scene.uv_bake_margin = bpy.props.IntProperty(
+    margin: bpy.props.IntProperty(
         name="Margin",
         description="Number of pixels to dilate around UV islands to prevent seams",
         default=8,
@@ -1156,7 +1388,7 @@ def register_properties():
         max=64
     )
     
-    bpy.types.Scene.uv_bake_island_margin = bpy.props.FloatProperty(
+    island_margin: bpy.props.FloatProperty(
         name="Island Margin",
         description="Scale factor for UV islands to close seam gaps (0.002 = 0.2% larger)",
         default=0.002,
@@ -1167,38 +1399,129 @@ def register_properties():
     )
 
 
+def register_properties():
+    """Register scene properties for UV baking settings"""
+    bpy.utils.register_class(UVBAKE_SceneSettings)
+    bpy.types.Scene.uv_bake = bpy.props.PointerProperty(type=UVBAKE_SceneSettings)
+
+
 def unregister_properties():
     """Unregister scene properties"""
-    del bpy.types.Scene.uv_bake_island_margin
-    del bpy.types.Scene.uv_bake_margin
-    del bpy.types.Scene.uv_bake_transparent
-    del bpy.types.Scene.uv_bake_res_y
-    del bpy.types.Scene.uv_bake_res_x
+    del bpy.types.Scene.uv_bake
+    bpy.utils.unregister_class(UVBAKE_SceneSettings)
+
+
+# Flat Scene properties used before the settings moved to Scene.uv_bake
+LEGACY_SCENE_PROPERTIES = {
+    'uv_bake_res_x': 'res_x',
+    'uv_bake_res_y': 'res_y',
+    'uv_bake_transparent': 'transparent',
+    'uv_bake_margin': 'margin',
+    'uv_bake_island_margin': 'island_margin',
+}
+
+
+@persistent
+def migrate_legacy_scene_settings(dummy):
+    """Handler called after a blend file is loaded: move old flat UV bake settings into Scene.uv_bake"""
+    for scene in bpy.data.scenes:
+        settings = scene.uv_bake
+        for old_name, new_name in LEGACY_SCENE_PROPERTIES.items():
+            if old_name not in scene:
+                continue
+            try:
+                # Saved values are plain ID properties now (bools may be stored as ints)
+                value_type = type(getattr(settings, new_name))
+                setattr(settings, new_name, value_type(scene[old_name]))
+                del scene[old_name]
+            except Exception as e:
+                print(f"UV Bake: Failed to migrate '{old_name}' on scene '{scene.name}': {e}")
+
+
+# ============================================================================
+# EEVEE Shader Prewarm
+# ============================================================================
+
+def prewarm_eevee_shaders():
+    """
+    Render a 64x64 throwaway scene with EEVEE so its shaders are compiled
+    before the first bake. Runs once from a timer after registration, and
+    only if enabled in the addon preferences (off by default).
+    
+    This is a full render: render_pre/render_post handlers fire, the
+    Render Result image is overwritten and the UI blocks until it is done.
+    
+    Returns:
+        None (one-shot timer)
+    """
+    addon = bpy.context.preferences.addons.get(__package__)
+    if not (addon and getattr(addon.preferences, 'prewarm_shaders', False)):
+        return None
+    
+    scene = bpy.data.scenes.new("UV_Bake_Prewarm")
+    mesh = material = obj = cam_data = camera = None
+    try:
+        scene.render.engine = 'BLENDER_EEVEE_NEXT'
+        scene.render.resolution_x = 64
+        scene.render.resolution_y = 64
+        scene.eevee.taa_render_samples = 1
+        
+        # A single quad with a default Principled BSDF material
+        mesh = bpy.data.meshes.new("UV_Bake_Prewarm")
+        mesh.from_pydata([(-1, -1, 0), (1, -1, 0), (1, 1, 0), (-1, 1, 0)], [], [(0, 1, 2, 3)])
+        material = bpy.data.materials.new("UV_Bake_Prewarm")
+        material.use_nodes = True
+        mesh.materials.append(material)
+        obj = bpy.data.objects.new("UV_Bake_Prewarm", mesh)
+        scene.collection.objects.link(obj)
+        
+        cam_data = bpy.data.cameras.new("UV_Bake_Prewarm")
+        camera = bpy.data.objects.new("UV_Bake_Prewarm_Camera", cam_data)
+        camera.location = (0, 0, 3)
+        scene.collection.objects.link(camera)
+        scene.camera = camera
+        
+        bpy.ops.render.render(scene=scene.name)
+        print("UV Bake: EEVEE shaders prewarmed")
+    except Exception as e:
+        print(f"UV Bake: Shader prewarm failed: {e}")
+    finally:
+        ids = [id_block for id_block in (camera, obj, cam_data, mesh, material, scene) if id_block]
+        bpy.data.batch_remove(ids=ids)
+    
+    return None
 
 
 # ============================================================================
 # Registration
 # ============================================================================
 
+classes = (
+    UVBAKE_AddonPreferences,
+    UVBAKE_PT_test_panel,
+    UVBAKE_OT_prepare_object,
+    UVBAKE_OT_setup_camera,
+    UVBAKE_OT_render,
+    UVBAKE_OT_cleanup_temp,
+    UVBAKE_OT_test_unfold,
+)
+
+register_classes, unregister_classes = bpy.utils.register_classes_factory(classes)
+
+
 def register():
     register_properties()
-    bpy.utils.register_class(UVBAKE_AddonPreferences)
-    bpy.utils.register_class(UVBAKE_PT_test_panel)
-    bpy.utils.register_class(UVBAKE_OT_prepare_object)
-    bpy.utils.register_class(UVBAKE_OT_setup_camera)
-    bpy.utils.register_class(UVBAKE_OT_render)
-    bpy.utils.register_class(UVBAKE_OT_cleanup_temp)
-    bpy.utils.register_class(UVBAKE_OT_test_unfold)
+    register_classes()
+    bpy.app.handlers.load_post.append(migrate_legacy_scene_settings)
+    bpy.app.timers.register(prewarm_eevee_shaders, first_interval=1.0)
 
 
 def unregister():
-    bpy.utils.unregister_class(UVBAKE_OT_test_unfold)
-    bpy.utils.unregister_class(UVBAKE_OT_cleanup_temp)
-    bpy.utils.unregister_class(UVBAKE_OT_render)
-    bpy.utils.unregister_class(UVBAKE_OT_setup_camera)
-    bpy.utils.unregister_class(UVBAKE_OT_prepare_object)
-    bpy.utils.unregister_class(UVBAKE_PT_test_panel)
-    bpy.utils.unregister_class(UVBAKE_AddonPreferences)
+    if migrate_legacy_scene_settings in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(migrate_legacy_scene_settings)
+    if bpy.app.timers.is_registered(prewarm_eevee_shaders):
+        bpy.app.timers.unregister(prewarm_eevee_shaders)
+    unregister_classes()
     unregister_properties()
 
 